@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import argparse
+
+from ai_opinion.config import DB_PATH
+from ai_opinion.db import DB
+from ai_opinion.api import serve
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve a read-only JSON API over the article database."
+    )
+    parser.add_argument("--db", default=DB_PATH, help="Path to SQLite DB")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pool-size", type=int, default=4, help="Read-only SQLite connections")
+    parser.add_argument("--cache-size", type=int, default=256, help="Cached responses (LRU)")
+    parser.add_argument("--max-age", type=int, default=30, help="Cache-Control max-age in seconds")
+    args = parser.parse_args()
+
+    # Bring the schema up to date once (FTS index, data version) before serving read-only
+    DB(args.db).conn.close()
+
+    httpd = serve(
+        args.db,
+        host=args.host,
+        port=args.port,
+        pool_size=args.pool_size,
+        cache_size=args.cache_size,
+        max_age=args.max_age,
+    )
+    print(f"🌐 Serving {args.db} on http://{args.host}:{args.port} (/articles, /search, /stances/by-year, /version)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
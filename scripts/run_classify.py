@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import argparse
+import socket
+import time
+from multiprocessing import Process
+
+from ai_opinion.config import (
+    DB_PATH,
+    STANCE_PARAMS,
+    CLASSIFY_BACKEND,
+    CLASSIFY_BATCH_SIZE,
+    CLASSIFY_LEASE_SECONDS,
+    CLASSIFY_MAX_ATTEMPTS,
+    STUDENT_MODEL_DIR,
+    GATE_MIN_MARGIN,
+)
+from ai_opinion.db import DB
+from ai_opinion.processing.stance import (
+    HIT_COLUMNS,
+    SCORE_COLUMNS,
+    StanceParams,
+    classify_all,
+    doc_text,
+    load_zero_shot,
+)
+from ai_opinion.processing.distill import load_student, student_classify, gated_classify
+
+BACKENDS = ["zero-shot", "gated", "student", "regex"]
+RESULT_COLUMNS = ["stance", "confidence", *SCORE_COLUMNS, *HIT_COLUMNS]
+
+
+def load_backend(name: str):
+    """Returns a function mapping a list of texts to a DataFrame of stance, confidence and any raw inputs."""
+    params = StanceParams(**STANCE_PARAMS)
+    if name == "regex":
+        return lambda texts: classify_all(texts, params=params)
+    if name == "zero-shot":
+        classifier = load_zero_shot()
+        return lambda texts: classify_all(texts, classifier, params=params)
+
+    student, meta = load_student(STUDENT_MODEL_DIR)
+    print(f"🎓 Loaded distilled student v{meta.get('version', '?')}")
+    if name == "student":
+        return lambda texts: student_classify(student, texts)
+
+    classifier = load_zero_shot()
+    return lambda texts: gated_classify(student, texts, classifier, min_margin=GATE_MIN_MARGIN, params=params)
+
+
+def result_rows(ids, results):
+    """(article_id, stance, confidence, raw scores..., regex hits...) with NULL for anything missing."""
+    frame = results.reindex(columns=RESULT_COLUMNS)
+    for col in HIT_COLUMNS:
+        frame[col] = frame[col].map({True: 1, False: 0})
+    frame = frame.astype(object).where(frame.notna(), None)
+    return [(i, *row) for i, row in zip(ids, frame.itertuples(index=False, name=None))]
+
+
+def work(args, worker: str):
+    db = DB(args.db)
+    classify = load_backend(args.backend)
+    done = 0
+
+    while True:
+        batch = db.claim_batch(worker, args.batch_size, args.lease_seconds, args.max_attempts)
+        if not batch:
+            if not args.follow:
+                break
+            time.sleep(args.poll_seconds)
+            db.enqueue_unclassified()
+            continue
+
+        ids = [r[0] for r in batch]
+        texts = [doc_text(title, abstract) for _, title, abstract in batch]
+        try:
+            results = classify(texts)
+        except Exception as e:
+            failed = db.release_batch(worker, args.max_attempts)
+            print(f"⚠️ {worker}: batch {ids[0]}..{ids[-1]} failed: {e}"
+                  + (f" ({failed} articles gave up after {args.max_attempts} attempts)" if failed else ""))
+            continue
+
+        done += db.complete_batch(worker, result_rows(ids, results), backend=args.backend)
+        print(f"✅ {worker}: {done} classified (last id {ids[-1]})")
+
+    print(f"🏁 {worker}: queue empty, {done} classified")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Classify queued articles in the background and store their stances."
+    )
+    parser.add_argument("--db", default=DB_PATH, help="Path to SQLite DB")
+    parser.add_argument("--backend", choices=BACKENDS, default=CLASSIFY_BACKEND)
+    parser.add_argument("--batch-size", type=int, default=CLASSIFY_BATCH_SIZE)
+    parser.add_argument("--lease-seconds", type=float, default=CLASSIFY_LEASE_SECONDS,
+                        help="Batches not completed within this time are reclaimed by other workers")
+    parser.add_argument("--max-attempts", type=int, default=CLASSIFY_MAX_ATTEMPTS,
+                        help="Mark an article failed after this many unsuccessful leases")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Requeue articles previously marked failed")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="Worker processes to start on this machine")
+    parser.add_argument("--follow", action="store_true",
+                        help="Keep polling for newly harvested articles instead of exiting")
+    parser.add_argument("--poll-seconds", type=float, default=30.0)
+    args = parser.parse_args()
+
+    # -------------------------------
+    # Queue anything not yet classified
+    # -------------------------------
+    db = DB(args.db)
+    if args.retry_failed:
+        print(f"🔁 Requeued {db.requeue_failed()} failed articles")
+    queued = db.enqueue_unclassified()
+    print(f"📋 Queued {queued} new articles; queue: {db.queue_stats()}")
+
+    # -------------------------------
+    # Workers
+    # -------------------------------
+    prefix = f"{socket.gethostname()}-{os.getpid()}"
+    if args.processes <= 1:
+        work(args, prefix)
+        return
+
+    procs = [Process(target=work, args=(args, f"{prefix}-{i}")) for i in range(args.processes)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    print(f"📋 Queue: {DB(args.db).queue_stats()}")
+
+
+if __name__ == "__main__":
+    main()
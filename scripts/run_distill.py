@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import argparse
+import time
+
+from ai_opinion.config import (
+    DB_PATH,
+    STUDENT_MODEL_DIR,
+    STUDENT_MIN_CONFIDENCE,
+    GATE_MIN_MARGIN,
+)
+from ai_opinion.db import DB
+from ai_opinion.processing.stance import ZERO_SHOT_MODEL, classify_all, doc_text, load_zero_shot
+from ai_opinion.processing.distill import train_student, save_student, evaluate_modes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Distill zero-shot stance labels into a fast TF-IDF student model."
+    )
+    parser.add_argument("--db", default=DB_PATH, help="Path to SQLite DB")
+    parser.add_argument("--out", default=STUDENT_MODEL_DIR, help="Directory for model artifacts")
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N articles")
+    parser.add_argument("--holdout", type=float, default=0.2,
+                        help="Fraction of articles kept back for agreement/throughput numbers")
+    parser.add_argument("--min-confidence", type=float, default=STUDENT_MIN_CONFIDENCE)
+    parser.add_argument("--min-margin", type=float, default=GATE_MIN_MARGIN)
+    parser.add_argument("--regex", action="store_true",
+                        help="Use regex-only teacher labels (no BART)")
+    args = parser.parse_args()
+
+    # -------------------------------
+    # Load corpus
+    # -------------------------------
+    df = DB(args.db).fetch_df()
+    if args.limit:
+        df = df.head(args.limit)
+    df = df.sample(frac=1.0, random_state=0).reset_index(drop=True)
+    texts = [doc_text(t, a) for t, a in zip(df["title"], df["abstract"])]
+
+    n_holdout = int(len(texts) * args.holdout)
+    train_texts, test_texts = texts[n_holdout:], texts[:n_holdout]
+    print(f"📚 {len(train_texts)} training / {len(test_texts)} holdout articles")
+
+    # -------------------------------
+    # Teacher labels
+    # -------------------------------
+    classifier = None if args.regex else load_zero_shot()
+    print("🧑‍🏫 Labelling with", "regex fallback" if args.regex else "zero-shot classifier")
+    teacher_train = classify_all(train_texts, classifier)
+
+    start = time.perf_counter()
+    teacher_test = classify_all(test_texts, classifier)
+    teacher_seconds = time.perf_counter() - start
+
+    # -------------------------------
+    # Train + save
+    # -------------------------------
+    model, n_used = train_student(train_texts, teacher_train, min_confidence=args.min_confidence)
+    teacher = {"teacher_backend": "regex"} if args.regex else {
+        "teacher_backend": "zero-shot",
+        "teacher": ZERO_SHOT_MODEL,
+    }
+    path = save_student(
+        model,
+        args.out,
+        **teacher,
+        min_confidence=args.min_confidence,
+        n_train=n_used,
+    )
+    print(f"💾 Trained on {n_used} high-confidence labels → {path}")
+
+    # -------------------------------
+    # Report
+    # -------------------------------
+    if test_texts:
+        report = evaluate_modes(
+            model, test_texts, teacher_test, teacher_seconds,
+            classifier=classifier, min_margin=args.min_margin,
+        )
+        print("\n=== Distillation Report ===")
+        print(report.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+        print("===========================")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,23 +15,36 @@ from ai_opinion.config import (
     ENABLE_ARXIV,
     ENABLE_OPENALEX,
     ENABLE_CROSSREF,
-    ENABLE_PHILPAPERS,
     ENABLE_PSYARXIV,
 )
 from ai_opinion.sources.arxiv_source import ArxivSource
 from ai_opinion.sources.openalex_source import OpenAlexSource
 from ai_opinion.sources.crossref_source import CrossRefSource
-from ai_opinion.sources.philpapers_source import PhilPapersSource
 from ai_opinion.sources.psyarxiv_source import PsyArxivSource
 from ai_opinion.db import DB
 
 
-def fetch_source(src):
+def harvest_source(src, db_path: str, batch_size: int = 1000):
+    """
+    Stream one source into the DB in batches of `batch_size`, so at most one batch per
+    source is held in memory. Runs in a worker thread, so it opens its own connection.
+    Returns (collected, stored).
+    """
+    db = DB(db_path)
+    collected = stored = 0
+    batch = []
     try:
-        return list(src.fetch())
+        for article in src.fetch():
+            batch.append(article)
+            collected += 1
+            if len(batch) >= batch_size:
+                stored += db.upsert_articles(batch)
+                batch = []
     except Exception as e:
         print(f"⚠️ {src.__class__.__name__} failed: {e}")
-        return []
+    stored += db.upsert_articles(batch)
+    db.conn.close()
+    return collected, stored
 
 
 def main():
@@ -67,45 +80,45 @@ def main():
         sources.append(OpenAlexSource(terms, start_year=start_year, max_records=args.max_records))
     if ENABLE_CROSSREF:
         sources.append(CrossRefSource(terms, start_year=start_year, max_records=args.max_records))
-    if ENABLE_PHILPAPERS:
-        sources.append(PhilPapersSource(terms, start_year=start_year, max_records=args.max_records))
     if ENABLE_PSYARXIV:
         sources.append(PsyArxivSource(terms, start_year=start_year, max_records=args.max_records))
 
     # -------------------------------
-    # Parallel Harvest
+    # Parallel Harvest + Store
     # -------------------------------
+    # Each source streams into the DB in fixed-size batches as it is fetched; only
+    # counts come back through the futures, never the records themselves.
     print(f"🔎 Fetching with terms: {terms} (from {start_year} onwards)")
-    articles = []
+    db = DB(args.db)  # creates/migrates the schema before the workers connect
+    collected = stored = 0
     with ThreadPoolExecutor(max_workers=len(sources)) as executor:
-        futures = {executor.submit(fetch_source, s): s for s in sources}
+        futures = {executor.submit(harvest_source, s, args.db): s for s in sources}
         for future in as_completed(futures):
             src = futures[future]
-            results = future.result()
-            print(f"📥 {src.__class__.__name__}: {len(results)} articles")
-            articles.extend(results)
+            n, new = future.result()
+            print(f"📥 {src.__class__.__name__}: {n} articles ({new} new)")
+            collected += n
+            stored += new
 
-    print(f"📥 Total collected: {len(articles)}")
-
-    # -------------------------------
-    # Store
-    # -------------------------------
-    db = DB(args.db)
-    db.upsert_articles(articles)
-    print(f"💾 Stored {len(articles)} articles into {args.db}")
+    print(f"📥 Total collected: {collected}")
+    print(f"💾 Stored {stored} new articles into {args.db}")
 
     # -------------------------------
     # Report
     # -------------------------------
     if args.report:
-        df = db.fetch_df()
+        total = this_year = 0
+        by_source = {}
+        year = datetime.now().year
+        for chunk in db.iter_df(columns=["source", "published"]):
+            total += len(chunk)
+            this_year += int((chunk["published"].dt.year == year).sum())
+            for name, count in chunk["source"].value_counts().items():
+                by_source[name] = by_source.get(name, 0) + int(count)
         print("\n=== Harvest Report ===")
-        print(f"DB size: {len(df)} articles total")
-        if "published" in df.columns:
-            this_year = df[df['published'].notna() & df['published'].str.startswith(str(datetime.now().year))]
-            print(f"This year: {len(this_year)} new articles")
-        sources_breakdown = df.groupby("source")["id"].count().to_dict()
-        print(f"By source: {sources_breakdown}")
+        print(f"DB size: {total} articles total")
+        print(f"This year: {this_year} new articles")
+        print(f"By source: {by_source}")
         print("======================")
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import argparse
+import json
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from ai_opinion.stubs import SOURCES, StubConfig, StubServer
+
+SCRIPTS = Path(__file__).resolve().parent
+SRC = SCRIPTS.parent / "src"
+
+
+def run_stage(name, cmd, env, log_dir):
+    """Run one pipeline stage as a child process; returns wall time and its own peak RSS."""
+    log_path = Path(log_dir) / f"{name}.log"
+    with open(log_path, "w") as log:
+        started = time.perf_counter()
+        proc = subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        seconds = time.perf_counter() - started
+    code = os.waitstatus_to_exitcode(status)
+    proc.returncode = code  # reaped by wait4 above
+    if code != 0:
+        print(log_path.read_text()[-3000:])
+        raise SystemExit(f"❌ Stage {name} exited with {code} (log: {log_path})")
+    return {"seconds": round(seconds, 2), "peak_rss_mb": round(usage.ru_maxrss / 1024, 1)}
+
+
+def count(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test harvest → store → classify against local stub APIs."
+    )
+    parser.add_argument("--records", type=int, default=20_000,
+                        help="Total synthetic corpus size, split evenly over the sources")
+    parser.add_argument("--start-year", type=int, default=datetime.now().year - 4)
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Median injected latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.6, help="Lognormal tail shape")
+    parser.add_argument("--throttle-rate", type=float, default=0.02, help="Share of 429 responses")
+    parser.add_argument("--error-rate", type=float, default=0.005, help="Share of 503 responses")
+    parser.add_argument("--backend", default="regex", help="run_classify.py backend for the analyze stage")
+    parser.add_argument("--workdir", default=None, help="Keep the DB and logs here (default: temp dir)")
+    parser.add_argument("--json", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    per_source = args.records // len(SOURCES)
+    config = StubConfig(
+        corpus={s: per_source for s in SOURCES},
+        start_year=args.start_year,
+        latency_median_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+    )
+    stub = StubServer(config).start()
+    print(f"🧪 Stub APIs on {stub.url}: {per_source} records per source")
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="greatdebate-load-")
+    Path(workdir).mkdir(parents=True, exist_ok=True)
+    db_path = str(Path(workdir) / "load.sqlite")
+    env = {**os.environ, **stub.base_urls(), "PYTHONPATH": str(SRC)}
+
+    # -------------------------------
+    # Pipeline stages (each in its own process, so peak RSS is per stage)
+    # -------------------------------
+    report = {"records_requested": per_source * len(SOURCES), "stages": {}}
+    try:
+        print("📥 Harvest + store ...")
+        stage = run_stage("harvest", [
+            sys.executable, str(SCRIPTS / "run_harvest.py"),
+            "--db", db_path,
+            "--start-year", str(args.start_year),
+            "--max-records", str(per_source),
+        ], env, workdir)
+        stage["records"] = count(db_path, "articles")
+        report["stages"]["harvest"] = stage
+
+        print("🧠 Classify ...")
+        stage = run_stage("classify", [
+            sys.executable, str(SCRIPTS / "run_classify.py"),
+            "--db", db_path,
+            "--backend", args.backend,
+            "--batch-size", "1000",
+        ], env, workdir)
+        stage["records"] = count(db_path, "stances")
+        report["stages"]["classify"] = stage
+    finally:
+        report["api"] = stub.stats()
+        stub.stop()
+
+    # -------------------------------
+    # Report
+    # -------------------------------
+    print("\n=== Load Test Report ===")
+    for name, stage in report["stages"].items():
+        rate = stage["records"] / max(stage["seconds"], 1e-9)
+        stage["records_per_sec"] = round(rate, 1)
+        print(f"{name:<9} {stage['records']:>9} records  {stage['seconds']:>8.1f}s  "
+              f"{rate:>9.1f} rec/s  peak RSS {stage['peak_rss_mb']:.0f} MB")
+    print("\nAPI requests (server-side latency, ms):")
+    for source, s in report["api"].items():
+        lat = s["latency_ms"]
+        print(f"{source:<9} {s['requests']:>6} req  p50 {lat['p50']}  p95 {lat['p95']}  "
+              f"p99 {lat['p99']}  max {lat['max']}  statuses {s['statuses']}")
+    print(f"\nDB and logs: {workdir}")
+    print("========================")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import argparse
+import time
+from dataclasses import fields
+
+import pandas as pd
+
+from ai_opinion.config import DB_PATH, STANCE_PARAMS
+from ai_opinion.db import DB
+from ai_opinion.processing.stance import HIT_COLUMNS, SCORE_COLUMNS, StanceParams, rescore
+
+
+def main():
+    defaults = StanceParams(**STANCE_PARAMS)
+    parser = argparse.ArgumentParser(
+        description="Re-derive stored stances from the persisted NLI scores and regex hits (no inference)."
+    )
+    parser.add_argument("--db", default=DB_PATH, help="Path to SQLite DB")
+    for f in fields(StanceParams):
+        flag = "--" + f.name.replace("_", "-")
+        parser.add_argument(flag, type=float, default=getattr(defaults, f.name),
+                            help=f"(default: {getattr(defaults, f.name)})")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only show how the stance distribution would change")
+    args = parser.parse_args()
+    params = StanceParams(**{f.name: getattr(args, f.name) for f in fields(StanceParams)})
+
+    # -------------------------------
+    # Load raw inputs
+    # -------------------------------
+    db = DB(args.db)
+    current = db.fetch_stance_inputs()
+    stored = pd.read_sql_query("SELECT article_id, stance FROM stances", db.conn)
+    current = current.merge(stored, on="article_id")
+
+    # Only rows whose label came from the rules (NLI-scored rows and regex-only rows) and
+    # whose regex hits were stored. Student-model labels have neither and are left alone;
+    # rows classified before the raw inputs were persisted have NULL hits and are skipped,
+    # since treating them as "no hits" would relabel every one of them.
+    has_scores = current[SCORE_COLUMNS].notna().all(axis=1)
+    has_hits = current[HIT_COLUMNS].notna().all(axis=1)
+    rules = has_scores | (current["backend"] == "regex")
+    eligible = current[rules & has_hits].reset_index(drop=True)
+    eligible[HIT_COLUMNS] = eligible[HIT_COLUMNS].astype(bool)
+    print(f"📋 {len(eligible)} of {len(current)} stances can be re-scored")
+
+    older = current["backend"].isin(["regex", "zero-shot"]) & ~has_hits
+    if older.any():
+        print(f"⏭️ Skipped {int(older.sum())} regex/zero-shot stances stored without raw inputs "
+              f"(classified before they were persisted); reclassify them to make them re-scorable")
+
+    # -------------------------------
+    # Re-score
+    # -------------------------------
+    start = time.perf_counter()
+    result = rescore(eligible, params)
+    elapsed = (time.perf_counter() - start) * 1000
+    changed = result["stance"] != eligible["stance"]
+    print(f"⚡ Re-scored in {elapsed:.1f} ms with {params}")
+
+    print("\n=== Stance distribution ===")
+    print(pd.DataFrame({
+        "before": eligible["stance"].value_counts(),
+        "after": result["stance"].value_counts(),
+    }).fillna(0).astype(int).to_string())
+    print(f"Changed: {int(changed.sum())}")
+    print("===========================")
+
+    # -------------------------------
+    # Store
+    # -------------------------------
+    if not args.dry_run:
+        n = db.update_stances(zip(
+            result["stance"],
+            result["confidence"].astype(float),
+            eligible["article_id"].astype(int).tolist(),
+        ))
+        print(f"💾 Updated {n} stances in {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ai_opinion.config import (
+    QUERY_TERMS,
+    MAX_RECORDS,
+    DB_PATH,
+    START_YEAR,
+    SHARD_DIR,
+    ENABLE_ARXIV,
+    ENABLE_OPENALEX,
+    ENABLE_CROSSREF,
+    ENABLE_PSYARXIV,
+)
+from ai_opinion.shards import (
+    SOURCES,
+    plan_shards,
+    write_manifest,
+    load_manifest,
+    shard_status,
+    status_counts,
+    select_shards,
+    run_shard,
+    merge_shards,
+)
+
+
+def enabled_sources():
+    flags = {
+        "arxiv": ENABLE_ARXIV,
+        "openalex": ENABLE_OPENALEX,
+        "crossref": ENABLE_CROSSREF,
+        "psyarxiv": ENABLE_PSYARXIV,
+    }
+    return [name for name, on in flags.items() if on]
+
+
+def cmd_plan(args):
+    shards = plan_shards(
+        args.sources or enabled_sources(),
+        args.start_year,
+        args.end_year or datetime.now().year,
+        window_years=args.window_years,
+    )
+    path = write_manifest(args.dir, shards, args.query or QUERY_TERMS, args.max_records)
+    print(f"🗺️ Planned {len(shards)} shards → {path}")
+
+
+def cmd_run(args):
+    manifest = load_manifest(args.dir)
+    node, nodes = (int(x) for x in args.node.split("/"))
+    shards = select_shards(args.dir, node=node, nodes=nodes, shard_ids=args.shard)
+    print(f"🔎 Node {node}/{nodes}: {len(shards)} shards to harvest with {args.processes} processes")
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.processes) as executor:
+        futures = {
+            executor.submit(run_shard, args.dir, s, manifest["terms"], manifest["max_records"]): s["id"]
+            for s in shards
+        }
+        for future in as_completed(futures):
+            marker = future.result()
+            if "error" in marker:
+                failed += 1
+                print(f"⚠️ {futures[future]} failed: {marker['error']}")
+            else:
+                print(f"📥 {futures[future]}: {marker['records']} articles in {marker['seconds']}s")
+
+    print(f"📋 Shards: {status_counts(args.dir)}")
+    if failed:
+        print(f"↻ Rerun `run` to retry the {failed} failed shards.")
+
+
+def cmd_merge(args):
+    added, missing = merge_shards(args.dir, args.db, remerge=args.remerge)
+    for shard_id, n in added.items():
+        print(f"💾 {shard_id}: {n} new articles")
+    for shard_id in missing:
+        print(f"⚠️ {shard_id}: done, but {shard_id}.sqlite is not in {args.dir}; skipped (copy it back and merge again)")
+    print(f"💾 Merged {len(added)} shards, {sum(added.values())} new articles into {args.db}")
+    print(f"📋 Shards: {status_counts(args.dir)}")
+
+
+def cmd_status(args):
+    for shard in load_manifest(args.dir)["shards"]:
+        print(f"{shard['id']:<32} {shard_status(args.dir, shard['id'])}")
+    print(f"📋 Shards: {status_counts(args.dir)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sharded harvest: plan shards, harvest each into its own DB, merge into the main DB."
+    )
+    parser.add_argument("--dir", default=SHARD_DIR, help="Shard directory (manifest + shard DBs)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("plan", help="Split the query space by source and year window")
+    p.add_argument("--query", nargs="*", help="Override query terms")
+    p.add_argument("--sources", nargs="*", choices=sorted(SOURCES),
+                   help="Sources to shard (default: those enabled in config)")
+    p.add_argument("--start-year", type=int, default=START_YEAR)
+    p.add_argument("--end-year", type=int, default=None, help="Default: current year")
+    p.add_argument("--window-years", type=int, default=1, help="Publication years per shard")
+    p.add_argument("--max-records", type=int, default=MAX_RECORDS, help="Cap per shard")
+    p.set_defaults(func=cmd_plan)
+
+    p = sub.add_parser("run", help="Harvest pending and failed shards")
+    p.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--node", default="0/1",
+                   help="i/N: this machine takes every N-th shard starting at i")
+    p.add_argument("--shard", nargs="*", help="Only these shard ids (ignores --node)")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("merge", help="Merge finished shards into the main DB")
+    p.add_argument("--db", default=DB_PATH, help="Path to the main SQLite DB")
+    p.add_argument("--remerge", action="store_true", help="Also re-merge already merged shards")
+    p.set_defaults(func=cmd_merge)
+
+    p = sub.add_parser("status", help="Show each shard's status")
+    p.set_defaults(func=cmd_status)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
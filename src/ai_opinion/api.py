@@ -0,0 +1,272 @@
+# src/ai_opinion/api.py
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .readonly import LRUCache, ReadOnlyPool
+
+MAX_PER_PAGE = 500
+
+_ARTICLE_COLUMNS = """
+    a.id, a.source, a.external_id, a.title, a.authors, a.abstract, a.url,
+    a.published, a.venue, s.stance, s.confidence
+"""
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class QueryAPI:
+    """
+    Read-only JSON endpoints over the article DB:
+
+      GET /articles           ?source= &stance= &year_from= &year_to= &page= &per_page=
+      GET /search?q=...       full-text search (FTS5 when available), same filters and paging
+      GET /stances/by-year    ?source= &year_from= &year_to=
+      GET /version            current data version
+
+    Every response carries an ETag (and, once the last write is over a second old, a
+    Last-Modified) derived from the DB's data version, so clients can poll with
+    If-None-Match / If-Modified-Since and get 304s.
+    Bodies are cached per (version, request) in an LRU.
+    """
+    def __init__(self, db_path: str, pool_size: int = 4, cache_size: int = 256, max_age: int = 30):
+        self.pool = ReadOnlyPool(db_path, size=pool_size)
+        self.cache = LRUCache(cache_size)
+        self.max_age = max_age
+        self.routes = {
+            "/articles": self.articles,
+            "/search": self.search,
+            "/stances/by-year": self.stances_by_year,
+            "/version": self.version,
+        }
+        with self.pool.connection() as conn:
+            self.has_fts = bool(conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+            ).fetchone())
+
+    def handle(self, target: str, headers) -> Tuple[int, Dict[str, str], bytes]:
+        """Returns (status, headers, body) for a GET of `target` (path + query string)."""
+        parsed = urlparse(target)
+        route = self.routes.get(parsed.path.rstrip("/") or "/")
+        if route is None:
+            return _json(404, {"error": f"unknown endpoint {parsed.path}"})
+
+        version, updated_at = self.pool.data_version()
+        query = tuple(sorted((k, v[0]) for k, v in parse_qs(parsed.query).items()))
+        key = (version, parsed.path, query)
+        digest = hashlib.sha1(repr(key[1:]).encode()).hexdigest()[:10]
+        cache_headers = {
+            "ETag": f'"{version}-{digest}"',
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        modified = _last_modified(updated_at)
+        if modified:
+            cache_headers["Last-Modified"] = format_datetime(modified, usegmt=True)
+
+        if _not_modified(headers, cache_headers["ETag"], modified):
+            return 304, cache_headers, b""
+
+        body = self.cache.get(key)
+        if body is None:
+            try:
+                body = json.dumps(route(dict(query)), ensure_ascii=False).encode("utf-8")
+            except BadRequest as e:
+                return _json(400, {"error": str(e)})
+            self.cache.put(key, body)
+        return 200, {**cache_headers, "Content-Type": "application/json"}, body
+
+    # --------------------------
+    # Endpoints
+    # --------------------------
+    def articles(self, q: dict) -> dict:
+        where, args = _filters(q)
+        page, per_page = _paging(q)
+        sql_where = f"WHERE {' AND '.join(where)}" if where else ""
+        with self.pool.connection() as conn:
+            total = conn.execute(
+                f"SELECT COUNT(*) FROM articles a LEFT JOIN stances s ON s.article_id = a.id {sql_where}",
+                args,
+            ).fetchone()[0]
+            rows = conn.execute(f"""
+                SELECT {_ARTICLE_COLUMNS}
+                FROM articles a LEFT JOIN stances s ON s.article_id = a.id
+                {sql_where}
+                ORDER BY a.published DESC, a.id DESC
+                LIMIT ? OFFSET ?
+            """, (*args, per_page, (page - 1) * per_page)).fetchall()
+        return _page(rows, total, page, per_page)
+
+    def search(self, q: dict) -> dict:
+        text = (q.get("q") or "").strip()
+        if not text:
+            raise BadRequest("q is required")
+        where, args = _filters(q)
+        page, per_page = _paging(q)
+
+        if self.has_fts:
+            # Quote each term so user input can't inject FTS query syntax
+            match = " ".join('"' + t.replace('"', '""') + '"' for t in text.split())
+            base = """
+                FROM articles_fts f
+                JOIN articles a ON a.id = f.rowid
+                LEFT JOIN stances s ON s.article_id = a.id
+                WHERE articles_fts MATCH ?
+            """
+            args = [match, *args]
+            order = "ORDER BY bm25(articles_fts)"
+        else:
+            base = """
+                FROM articles a LEFT JOIN stances s ON s.article_id = a.id
+                WHERE (a.title LIKE ? OR a.abstract LIKE ?)
+            """
+            args = [f"%{text}%", f"%{text}%", *args]
+            order = "ORDER BY a.published DESC, a.id DESC"
+        if where:
+            base += " AND " + " AND ".join(where)
+
+        with self.pool.connection() as conn:
+            total = conn.execute(f"SELECT COUNT(*) {base}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {_ARTICLE_COLUMNS} {base} {order} LIMIT ? OFFSET ?",
+                (*args, per_page, (page - 1) * per_page),
+            ).fetchall()
+        return _page(rows, total, page, per_page)
+
+    def stances_by_year(self, q: dict) -> dict:
+        where, args = _filters({k: v for k, v in q.items() if k != "stance"})
+        where = ["s.stance IS NOT NULL", "a.published IS NOT NULL", *where]
+        with self.pool.connection() as conn:
+            rows = conn.execute(f"""
+                SELECT CAST(substr(a.published, 1, 4) AS INTEGER) AS year, s.stance, COUNT(*)
+                FROM articles a JOIN stances s ON s.article_id = a.id
+                WHERE {' AND '.join(where)}
+                GROUP BY year, s.stance
+                ORDER BY year, s.stance
+            """, args).fetchall()
+
+        totals: Dict[int, int] = {}
+        for year, _, n in rows:
+            totals[year] = totals.get(year, 0) + n
+        return {"items": [
+            {"year": year, "stance": stance, "count": n, "prop": round(n / totals[year], 4)}
+            for year, stance, n in rows
+        ]}
+
+    def version(self, q: dict) -> dict:
+        version, updated_at = self.pool.data_version()
+        return {"version": version, "updated_at": updated_at}
+
+
+def _filters(q: dict):
+    where, args = [], []
+    if q.get("source"):
+        where.append("a.source = ?")
+        args.append(q["source"])
+    if q.get("stance"):
+        where.append("s.stance = ?")
+        args.append(q["stance"])
+    if q.get("year_from"):
+        where.append("a.published >= ?")
+        args.append(str(_int(q, "year_from")))
+    if q.get("year_to"):
+        where.append("a.published < ?")
+        args.append(str(_int(q, "year_to") + 1))
+    return where, args
+
+
+def _paging(q: dict):
+    page = _int(q, "page", 1)
+    per_page = _int(q, "per_page", 50)
+    if page < 1 or not 1 <= per_page <= MAX_PER_PAGE:
+        raise BadRequest(f"page must be >= 1 and per_page between 1 and {MAX_PER_PAGE}")
+    return page, per_page
+
+
+def _int(q: dict, name: str, default: Optional[int] = None) -> int:
+    try:
+        return int(q.get(name, default))
+    except (TypeError, ValueError):
+        raise BadRequest(f"{name} must be an integer")
+
+
+def _page(rows, total, page, per_page) -> dict:
+    items = []
+    for (id_, source, external_id, title, authors, abstract, url,
+         published, venue, stance, confidence) in rows:
+        try:
+            authors = json.loads(authors) if authors else []
+        except ValueError:
+            authors = []
+        items.append({
+            "id": id_, "source": source, "external_id": external_id, "title": title,
+            "authors": authors, "abstract": abstract, "url": url, "published": published,
+            "venue": venue, "stance": stance, "confidence": confidence,
+        })
+    return {"page": page, "per_page": per_page, "total": total, "items": items}
+
+
+def _json(status: int, data: dict):
+    return status, {"Content-Type": "application/json"}, json.dumps(data).encode("utf-8")
+
+
+def _last_modified(value: Optional[str]) -> Optional[datetime]:
+    """
+    Last-Modified for a data_version.updated_at (naive UTC), or None if it can't be used.
+    HTTP dates have whole-second precision but the version can change several times a
+    second, so a timestamp within the last second is only a weak validator (RFC 9110
+    8.8.2.2): it is neither sent nor checked, and clients fall back to the ETag.
+    """
+    if not value:
+        return None
+    try:
+        modified = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    if datetime.now(timezone.utc) - modified < timedelta(seconds=1):
+        return None
+    return modified.replace(microsecond=0)
+
+
+def _not_modified(headers, etag: str, modified: Optional[datetime]) -> bool:
+    inm = headers.get("If-None-Match")
+    if inm:
+        return etag in [t.strip() for t in inm.split(",")] or inm.strip() == "*"
+    ims = headers.get("If-Modified-Since")
+    if ims and modified:
+        try:
+            return modified <= parsedate_to_datetime(ims)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def serve(db_path: str, host: str = "127.0.0.1", port: int = 8000, **kwargs) -> ThreadingHTTPServer:
+    """Build (but don't start) a threaded HTTP server for the API."""
+    api = QueryAPI(db_path, **kwargs)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            try:
+                status, headers, body = api.handle(self.path, self.headers)
+            except sqlite3.Error as e:
+                status, headers, body = _json(503, {"error": f"database unavailable: {e}"})
+            self.send_response(status)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+    return httpd
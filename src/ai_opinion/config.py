@@ -1,4 +1,5 @@
 # src/ai_opinion/config.py
+import os
 
 # --- Query terms ---
 # Broad search terms for harvesting AI-related papers
@@ -11,6 +12,15 @@ QUERY_TERMS = [
 MAX_RECORDS = 500
 START_YEAR = 2020  # Default lower bound for publication year
 
+# --- Source API endpoints ---
+# Overridable from the environment, e.g. to point the harvester at scripts/run_loadtest.py's stub server
+ARXIV_BASE_URL = os.environ.get("ARXIV_BASE_URL", "https://export.arxiv.org/api/query")
+OPENALEX_BASE_URL = os.environ.get("OPENALEX_BASE_URL", "https://api.openalex.org/works")
+CROSSREF_BASE_URL = os.environ.get("CROSSREF_BASE_URL", "https://api.crossref.org/works")
+PSYARXIV_BASE_URL = os.environ.get("PSYARXIV_BASE_URL", "https://api.osf.io/v2/preprints/")
+# arXiv asks API clients to wait 3 seconds between consecutive requests
+ARXIV_DELAY_SECONDS = float(os.environ.get("ARXIV_DELAY_SECONDS", "3"))
+
 # --- Database ---
 DB_PATH = "./ai_opinion.sqlite"
 
@@ -19,3 +29,22 @@ ENABLE_ARXIV = True
 ENABLE_OPENALEX = True
 ENABLE_CROSSREF = True
 ENABLE_PSYARXIV = True
+
+# --- Stance distillation ---
+STUDENT_MODEL_DIR = "./models"
+STUDENT_MIN_CONFIDENCE = 0.6  # Teacher labels below this are not used for training
+GATE_MIN_MARGIN = 0.2         # Student top-2 margin below this escalates to BART
+
+# --- Background classification (scripts/run_classify.py) ---
+CLASSIFY_BACKEND = "zero-shot"  # zero-shot | gated | student | regex
+CLASSIFY_BATCH_SIZE = 64
+CLASSIFY_LEASE_SECONDS = 600    # Leased batches not finished in time are reclaimed
+CLASSIFY_MAX_ATTEMPTS = 3       # Articles that fail this many times are marked failed
+
+# --- Sharded harvest (scripts/run_shards.py) ---
+SHARD_DIR = "./shards"
+
+# --- Stance rules (ai_opinion.processing.stance.StanceParams) ---
+# Overrides for the booster weights / thresholds used by run_classify.py and run_rescore.py,
+# e.g. {"uncertain_threshold": 0.45}. Empty means the built-in defaults.
+STANCE_PARAMS = {}
@@ -1,14 +1,28 @@
 # src/ai_opinion/db.py
+import os
 import sqlite3
 import json
+import time
 from datetime import datetime
-from typing import Iterable
+from typing import Iterable, List, Optional, Tuple
 from .types import Article
 
+# NLI score per label (NULL for regex-only/student rows) and regex hit flags
+STANCE_RAW_COLUMNS = [
+    ("score_yes", "REAL"),
+    ("score_no", "REAL"),
+    ("score_uncertain", "REAL"),
+    ("hit_yes", "INTEGER"),
+    ("hit_no", "INTEGER"),
+    ("hit_uncertain", "INTEGER"),
+]
+
 class DB:
-    def __init__(self, path: str = "ai_opinion.sqlite"):
-        self.conn = sqlite3.connect(path)
+    def __init__(self, path: str = "ai_opinion.sqlite", timeout: float = 30.0):
+        # timeout: how long to wait on another process's write lock (classification workers)
+        self.conn = sqlite3.connect(path, timeout=timeout)
         self.conn.execute("PRAGMA foreign_keys = ON;")
+        self.conn.execute("PRAGMA journal_mode = WAL;")  # readers don't block the writer
         self.create_schema()
 
     def create_schema(self):
@@ -30,34 +44,313 @@ class DB:
             UNIQUE(source, external_id)
         )
         """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS stances (
+            article_id INTEGER PRIMARY KEY REFERENCES articles(id) ON DELETE CASCADE,
+            stance TEXT,
+            confidence REAL,
+            backend TEXT,
+            classified_at TEXT
+        )
+        """)
+        # Raw model inputs to the stance rules, so they can be re-run without inference
+        # (scripts/run_rescore.py). Added after the table, so older DBs gain them here.
+        have = {r[1] for r in cur.execute("PRAGMA table_info(stances)")}
+        for col, kind in STANCE_RAW_COLUMNS:
+            if col not in have:
+                cur.execute(f"ALTER TABLE stances ADD COLUMN {col} {kind}")
+        # Work queue for scripts/run_classify.py.
+        # status: pending -> leased (owned by lease_owner until lease_expires) -> done,
+        # or failed once a row has been leased max_attempts times without completing
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS classify_queue (
+            article_id INTEGER PRIMARY KEY REFERENCES articles(id) ON DELETE CASCADE,
+            status TEXT NOT NULL DEFAULT 'pending',
+            lease_owner TEXT,
+            lease_expires REAL,
+            attempts INTEGER NOT NULL DEFAULT 0
+        )
+        """)
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_classify_queue_status ON classify_queue(status, lease_expires)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published)")
+        self._create_fts(cur)
+        # Change counter bumped by every write to articles/stances; readers key caches on it.
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """)
+        cur.execute(
+            "INSERT OR IGNORE INTO data_version (id, version, updated_at) VALUES (1, 0, ?)",
+            (datetime.utcnow().isoformat(),),
+        )
         self.conn.commit()
 
-    def upsert_articles(self, articles: Iterable[Article]):
-        cur = self.conn.cursor()
+    def _create_fts(self, cur):
+        """Full-text index over title/abstract, kept in sync by triggers. Skipped if SQLite lacks FTS5."""
+        exists = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        if exists:
+            return
+        try:
+            cur.execute("""
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                title, abstract, content='articles', content_rowid='id'
+            )
+            """)
+        except sqlite3.OperationalError:
+            return
+        cur.executescript("""
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts (rowid, title, abstract) VALUES (new.id, new.title, new.abstract);
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title, abstract)
+            VALUES ('delete', old.id, old.title, old.abstract);
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title, abstract)
+            VALUES ('delete', old.id, old.title, old.abstract);
+            INSERT INTO articles_fts (rowid, title, abstract) VALUES (new.id, new.title, new.abstract);
+        END;
+        INSERT INTO articles_fts (articles_fts) VALUES ('rebuild');
+        """)
+
+    def _bump_version(self):
+        """Call inside a write transaction, before its commit."""
+        self.conn.execute(
+            "UPDATE data_version SET version = version + 1, updated_at = ? WHERE id = 1",
+            (datetime.utcnow().isoformat(),),
+        )
+
+    def data_version(self) -> Tuple[int, str]:
+        return self.conn.execute("SELECT version, updated_at FROM data_version WHERE id = 1").fetchone()
+
+    def upsert_articles(self, articles: Iterable[Article]) -> int:
+        """Insert new articles (existing (source, external_id) pairs are ignored). Streams the iterable."""
         sql = """
             INSERT OR IGNORE INTO articles
             (source, external_id, title, authors, abstract, url, published, venue, topics, sentiment_compound, added_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        for a in articles:
-            cur.execute(
-                sql,
-                (
-                    a.source,
-                    a.external_id,
-                    a.title,
-                    json.dumps(a.authors, ensure_ascii=False),
-                    a.abstract,
-                    a.url,
-                    a.published.isoformat() if getattr(a, "published", None) else None,
-                    getattr(a, "venue", None),
-                    json.dumps(getattr(a, "topics", []) or [], ensure_ascii=False),
-                    getattr(a, "sentiment_compound", None),
-                    datetime.utcnow().isoformat(),
-                ),
+        added_at = datetime.utcnow().isoformat()
+        rows = (
+            (
+                a.source,
+                a.external_id,
+                a.title,
+                json.dumps(a.authors, ensure_ascii=False),
+                a.abstract,
+                a.url,
+                a.published.isoformat() if getattr(a, "published", None) else None,
+                getattr(a, "venue", None),
+                json.dumps(getattr(a, "topics", []) or [], ensure_ascii=False),
+                getattr(a, "sentiment_compound", None),
+                added_at,
             )
+            for a in articles
+        )
+        cur = self.conn.executemany(sql, rows)
+        if cur.rowcount:
+            self._bump_version()
         self.conn.commit()
+        return cur.rowcount
+
+    def merge_from(self, path: str) -> int:
+        """
+        Copy articles from another DB file (e.g. a harvest shard), deduplicating on
+        (source, external_id). Returns the number of new articles.
+        Raises FileNotFoundError if `path` does not exist (ATTACH would create it empty).
+        """
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No such database file: {path}")
+        cols = "source, external_id, title, authors, abstract, url, published, venue, topics, sentiment_compound, added_at"
+        self.conn.commit()
+        self.conn.execute("ATTACH DATABASE ? AS shard", (path,))
+        try:
+            cur = self.conn.execute(
+                f"INSERT OR IGNORE INTO articles ({cols}) SELECT {cols} FROM shard.articles ORDER BY id"
+            )
+            if cur.rowcount:
+                self._bump_version()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self.conn.execute("DETACH DATABASE shard")
+        return cur.rowcount
 
     def fetch_df(self):
         import pandas as pd
         return pd.read_sql_query("SELECT * FROM articles", self.conn)
+
+    def iter_df(self, chunksize: int = 50_000, columns: Optional[List[str]] = None):
+        """
+        Yield the articles table as DataFrames of at most `chunksize` rows, in id order.
+        `source`/`venue` are categoricals (same categories in every chunk, so chunks concat cheaply)
+        and `published`/`added_at` are parsed to UTC datetimes.
+        """
+        import pandas as pd
+
+        known = [r[1] for r in self.conn.execute("PRAGMA table_info(articles)")]
+        columns = columns or known
+        unknown = set(columns) - set(known)
+        if unknown:
+            raise ValueError(f"Unknown article columns: {sorted(unknown)}")
+
+        dtypes = {
+            col: pd.CategoricalDtype(sorted(
+                r[0] for r in self.conn.execute(f"SELECT DISTINCT {col} FROM articles WHERE {col} IS NOT NULL")
+            ))
+            for col in ("source", "venue") if col in columns
+        }
+
+        sql = f"SELECT {', '.join(columns)} FROM articles ORDER BY id"
+        for chunk in pd.read_sql_query(sql, self.conn, chunksize=chunksize):
+            for col, dtype in dtypes.items():
+                chunk[col] = chunk[col].astype(dtype)
+            for col in ("published", "added_at"):
+                if col in chunk:
+                    chunk[col] = pd.to_datetime(chunk[col], errors="coerce", utc=True, format="ISO8601")
+            yield chunk
+
+    # --------------------------
+    # Classification queue
+    # --------------------------
+    def enqueue_unclassified(self) -> int:
+        """Queue every article that has no stance yet. Returns the number newly queued."""
+        cur = self.conn.execute("""
+            INSERT OR IGNORE INTO classify_queue (article_id)
+            SELECT a.id FROM articles a
+            LEFT JOIN stances s ON s.article_id = a.id
+            WHERE s.article_id IS NULL
+        """)
+        self.conn.commit()
+        return cur.rowcount
+
+    def claim_batch(self, worker: str, size: int, lease_seconds: float,
+                    max_attempts: int = 3) -> List[Tuple[int, str, str]]:
+        """
+        Lease up to `size` pending articles (or ones whose lease expired) to `worker`.
+        Rows that were already tried are leased one at a time, so a document that keeps
+        failing only holds up itself; after `max_attempts` leases it is marked failed.
+        Returns (article_id, title, abstract) rows.
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")  # serialize claims between worker processes
+        try:
+            # Expired leases that have used up their attempts (the worker died on them every time)
+            self.conn.execute("""
+                UPDATE classify_queue SET status = 'failed', lease_owner = NULL, lease_expires = NULL
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """, (now, max_attempts))
+            rows = self.conn.execute("""
+                SELECT article_id, attempts FROM classify_queue
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY attempts > 0 DESC, article_id
+                LIMIT ?
+            """, (now, size)).fetchall()
+            if rows and rows[0][1] > 0:
+                rows = rows[:1]
+            ids = [r[0] for r in rows]
+            self.conn.executemany("""
+                UPDATE classify_queue
+                SET status = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE article_id = ?
+            """, [(worker, now + lease_seconds, i) for i in ids])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        if not ids:
+            return []
+        marks = ",".join("?" * len(ids))
+        return self.conn.execute(
+            f"SELECT id, title, abstract FROM articles WHERE id IN ({marks}) ORDER BY id", ids
+        ).fetchall()
+
+    def complete_batch(self, worker: str, results: Iterable[tuple], backend: str) -> int:
+        """
+        Store (article_id, stance, confidence, score_yes, score_no, score_uncertain,
+        hit_yes, hit_no, hit_uncertain) results and mark them done, in one transaction.
+        Rows whose lease was reclaimed by another worker are skipped. Returns rows written.
+        """
+        results = list(results)
+        now = datetime.utcnow().isoformat()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            owned = {
+                r[0] for r in self.conn.execute(
+                    "SELECT article_id FROM classify_queue WHERE status = 'leased' AND lease_owner = ?",
+                    (worker,),
+                )
+            }
+            rows = [r for r in results if r[0] in owned]
+            raw_cols = ", ".join(c for c, _ in STANCE_RAW_COLUMNS)
+            self.conn.executemany(f"""
+                INSERT OR REPLACE INTO stances
+                (article_id, stance, confidence, {raw_cols}, backend, classified_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(*r, backend, now) for r in rows])
+            self.conn.executemany("""
+                UPDATE classify_queue SET status = 'done', lease_owner = NULL, lease_expires = NULL
+                WHERE article_id = ?
+            """, [(r[0],) for r in rows])
+            if rows:
+                self._bump_version()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(rows)
+
+    def release_batch(self, worker: str, max_attempts: int = 3) -> int:
+        """
+        Hand a worker's leased rows back to the queue (e.g. after a classifier error).
+        Rows that have been tried `max_attempts` times are marked failed instead.
+        Returns the number marked failed.
+        """
+        failed = self.conn.execute("""
+            UPDATE classify_queue SET status = 'failed', lease_owner = NULL, lease_expires = NULL
+            WHERE status = 'leased' AND lease_owner = ? AND attempts >= ?
+        """, (worker, max_attempts)).rowcount
+        self.conn.execute("""
+            UPDATE classify_queue SET status = 'pending', lease_owner = NULL, lease_expires = NULL
+            WHERE status = 'leased' AND lease_owner = ?
+        """, (worker,))
+        self.conn.commit()
+        return failed
+
+    def requeue_failed(self) -> int:
+        """Give failed rows a fresh set of attempts. Returns the number requeued."""
+        cur = self.conn.execute(
+            "UPDATE classify_queue SET status = 'pending', attempts = 0 WHERE status = 'failed'"
+        )
+        self.conn.commit()
+        return cur.rowcount
+
+    def fetch_stance_inputs(self):
+        """Stored raw stance inputs (article_id, backend + STANCE_RAW_COLUMNS) as a DataFrame."""
+        import pandas as pd
+        raw_cols = ", ".join(c for c, _ in STANCE_RAW_COLUMNS)
+        return pd.read_sql_query(f"SELECT article_id, backend, {raw_cols} FROM stances", self.conn)
+
+    def update_stances(self, rows: Iterable[Tuple[str, float, int]]) -> int:
+        """Rewrite (stance, confidence, article_id) rows, e.g. after re-scoring. Returns rows changed."""
+        cur = self.conn.executemany(
+            "UPDATE stances SET stance = ?, confidence = ? WHERE article_id = ?", rows
+        )
+        if cur.rowcount:
+            self._bump_version()
+        self.conn.commit()
+        return cur.rowcount
+
+    def queue_stats(self) -> dict:
+        stats = {status: 0 for status in ("pending", "leased", "done", "failed")}
+        stats.update(self.conn.execute("SELECT status, COUNT(*) FROM classify_queue GROUP BY status"))
+        return stats
@@ -0,0 +1,166 @@
+# src/ai_opinion/processing/distill.py
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .stance import HIT_COLUMNS, SCORE_COLUMNS, StanceParams, classify_all
+
+ARTIFACT_PREFIX = "stance-student"
+
+
+def train_student(texts: List[str], teacher: pd.DataFrame, min_confidence: float = 0.6):
+    """
+    Fit a TF-IDF + logistic regression student on the teacher's high-confidence labels.
+    `teacher` is the DataFrame returned by `classify_all` (stance, confidence).
+    Returns (model, number of training rows used).
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+
+    keep = (teacher["confidence"] >= min_confidence).to_numpy()
+    X = [t for t, k in zip(texts, keep) if k]
+    y = teacher["stance"].to_numpy()[keep]
+    if len(set(y)) < 2:
+        raise ValueError(
+            f"Need at least two stances above confidence {min_confidence} to train a student"
+        )
+
+    model = make_pipeline(
+        TfidfVectorizer(
+            max_df=0.9,
+            min_df=2,
+            ngram_range=(1, 2),
+            sublinear_tf=True,
+            stop_words="english",
+        ),
+        LogisticRegression(max_iter=1000, class_weight="balanced"),
+    )
+    model.fit(X, y)
+    return model, len(y)
+
+
+def save_student(model, directory: str, **meta) -> Path:
+    """
+    Write the model as `<directory>/stance-student-v<N>.joblib` with a JSON sidecar.
+    N is one past the newest version already in the directory. `meta` should say
+    what made the training labels (e.g. teacher_backend, and teacher for a model).
+    """
+    import joblib
+
+    out = Path(directory)
+    out.mkdir(parents=True, exist_ok=True)
+    versions = [_version_of(p) for p in out.glob(f"{ARTIFACT_PREFIX}-v*.joblib")]
+    version = max(versions, default=0) + 1
+
+    path = out / f"{ARTIFACT_PREFIX}-v{version}.joblib"
+    meta = {
+        "version": version,
+        "labels": [str(c) for c in model.classes_],
+        "created_at": datetime.utcnow().isoformat(),
+        **meta,
+    }
+    joblib.dump(model, path)
+    path.with_suffix(".json").write_text(json.dumps(meta, indent=2))
+    return path
+
+
+def load_student(directory: str, version: Optional[int] = None):
+    """Load a student artifact (newest by default). Returns (model, meta)."""
+    import joblib
+
+    paths = sorted(Path(directory).glob(f"{ARTIFACT_PREFIX}-v*.joblib"), key=_version_of)
+    if version is not None:
+        paths = [p for p in paths if _version_of(p) == version]
+    if not paths:
+        raise FileNotFoundError(f"No {ARTIFACT_PREFIX} artifact in {directory}")
+
+    path = paths[-1]
+    meta_path = path.with_suffix(".json")
+    meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+    return joblib.load(path), meta
+
+
+def _version_of(path: Path) -> int:
+    return int(path.stem.rsplit("-v", 1)[1])
+
+
+def student_classify(model, texts: List[str]) -> pd.DataFrame:
+    """
+    Student predictions with `stance`, `confidence` and `margin`
+    (gap between the two most probable stances).
+    """
+    if not texts:
+        return pd.DataFrame({"stance": [], "confidence": [], "margin": []})
+
+    proba = model.predict_proba(texts)
+    top2 = np.sort(proba, axis=1)[:, -2:]
+    return pd.DataFrame({
+        "stance": model.classes_[proba.argmax(axis=1)],
+        "confidence": top2[:, 1],
+        "margin": top2[:, 1] - top2[:, 0],
+    })
+
+
+def gated_classify(model, texts: List[str], classifier=None, min_margin: float = 0.2,
+                   params: Optional[StanceParams] = None) -> pd.DataFrame:
+    """
+    Use the student for confident rows, escalate low-margin rows to `classify_all`.
+    Adds a `backend` column recording which model produced each label; escalated
+    rows also carry the teacher's raw score/hit columns.
+    """
+    out = student_classify(model, texts)
+    out["backend"] = "student"
+
+    escalate = np.flatnonzero(out["margin"].to_numpy() < min_margin)
+    if len(escalate):
+        teacher = classify_all([texts[i] for i in escalate], classifier, params=params)
+        teacher.index = escalate
+        out = out.join(teacher[SCORE_COLUMNS + HIT_COLUMNS])
+        out.loc[escalate, "stance"] = teacher["stance"]
+        out.loc[escalate, "confidence"] = teacher["confidence"]
+        out.loc[escalate, "backend"] = "teacher"
+    return out
+
+
+def evaluate_modes(model, texts: List[str], teacher: pd.DataFrame, teacher_seconds: float,
+                   classifier=None, min_margin: float = 0.2) -> pd.DataFrame:
+    """
+    Agreement with the teacher's labels and throughput (docs/sec) for each mode.
+    `teacher` and `teacher_seconds` come from a timed `classify_all` run over the same texts.
+    """
+    reference = teacher["stance"].to_numpy()
+
+    rows = [{
+        "mode": "teacher",
+        "agreement": 1.0,
+        "escalated": 1.0,
+        "docs_per_sec": len(texts) / max(teacher_seconds, 1e-9),
+    }]
+
+    start = time.perf_counter()
+    student = student_classify(model, texts)
+    elapsed = time.perf_counter() - start
+    rows.append({
+        "mode": "student",
+        "agreement": float((student["stance"].to_numpy() == reference).mean()),
+        "escalated": 0.0,
+        "docs_per_sec": len(texts) / max(elapsed, 1e-9),
+    })
+
+    start = time.perf_counter()
+    gated = gated_classify(model, texts, classifier, min_margin=min_margin)
+    elapsed = time.perf_counter() - start
+    rows.append({
+        "mode": "gated",
+        "agreement": float((gated["stance"].to_numpy() == reference).mean()),
+        "escalated": float((gated["backend"] == "teacher").mean()),
+        "docs_per_sec": len(texts) / max(elapsed, 1e-9),
+    })
+    return pd.DataFrame(rows)
+
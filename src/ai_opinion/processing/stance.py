@@ -0,0 +1,166 @@
+# src/ai_opinion/processing/stance.py
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+ZERO_SHOT_MODEL = "facebook/bart-large-mnli"
+LABELS = ["Yes", "No", "Uncertain"]
+
+# --------------------------
+# Regex patterns
+# --------------------------
+YES_PATTERNS = r"""(
+    (is|are|becomes?|has|shows|demonstrates?)\s+(sentient|conscious|self[- ]aware)|
+    (artificial|machine)\s+(consciousness|awareness|sentience)|
+    (possesses?|exhibits?|capable of)\s+(awareness|conscious thought|subjective experience|qualia)|
+    (deserves?|should be granted)\s+(personhood|moral consideration|rights)
+)"""
+
+NO_PATTERNS = r"""(
+    (not|never|cannot|can't|won't|isn't|aren't)\s+(sentient|conscious|self[- ]aware)|
+    (does\s+not|fails?\s+to|unlikely\s+to)\s+(show|exhibit|possess)\s+(consciousness|awareness|sentience)|
+    lacks?\s+(sentience|consciousness|awareness)|
+    no\s+(evidence|sign|proof|basis)\s+(of|for)\s+(sentience|consciousness|awareness)|
+    merely\s+(a|an)\s+(tool|program|system|simulation|statistical model)|
+    (just|only)\s+(an?\s+)?(algorithm|pattern recognizer|language model)|
+    incapable of\s+(feeling|experience|awareness|subjectivity)|
+    unfounded\s+(claims|assumptions)\s+about\s+(sentience|consciousness)
+)"""
+
+UNCERTAIN_PATTERNS = r"""(
+    (might|may|could|possibly|perhaps)\s+(be|become)\s+(sentient|conscious|aware)|
+    uncertain(ty)?\s+(about|regarding)?\s+(sentience|consciousness|awareness)|
+    debate(s|d)?\s+(whether|if)\s+(AI|machines?)\s+(are|can be)\s+(sentient|conscious)|
+    (open|ongoing)\s+question\s+(of|about)\s+(sentience|consciousness)|
+    controversial\s+(topic|issue)\s+(about|regarding)\s+(AI\s+)?(sentience|consciousness)|
+    unclear\s+if\s+(AI|machines?)\s+(are|can be)\s+(sentient|conscious)
+)"""
+
+
+_YES_RE, _NO_RE, _UNCERTAIN_RE = (
+    re.compile(p) for p in (YES_PATTERNS, NO_PATTERNS, UNCERTAIN_PATTERNS)
+)
+
+# Raw per-article inputs persisted alongside the stance, in LABELS order
+SCORE_COLUMNS = ["score_yes", "score_no", "score_uncertain"]
+HIT_COLUMNS = ["hit_yes", "hit_no", "hit_uncertain"]
+
+
+@dataclass(frozen=True)
+class StanceParams:
+    """Post-processing rules that turn raw NLI scores + regex hits into a stance and confidence."""
+    yes_boost: float = 0.2
+    no_boost: float = 0.25
+    uncertain_boost: float = 0.05
+    uncertain_threshold: float = 0.4  # best normalized score below this -> "Uncertain"
+    tie_margin: float = 0.15          # "Uncertain" winner becomes Yes/No when |Yes - No| is below this
+    # confidences for regex-only rows (no NLI scores), by the first pattern group that hits
+    regex_no_confidence: float = 0.85
+    regex_yes_confidence: float = 0.75
+    regex_uncertain_confidence: float = 0.6
+    regex_default_confidence: float = 0.55  # no hits: lean "No"
+
+
+def doc_text(title, abstract) -> str:
+    return " ".join(filter(None, [str(title or ""), str(abstract or "")]))
+
+
+def load_zero_shot(device: int = 0):
+    from transformers import pipeline
+    return pipeline(
+        "zero-shot-classification",
+        model=ZERO_SHOT_MODEL,
+        device=device  # use GPU if available
+    )
+
+
+def regex_hits(texts: List[str]) -> pd.DataFrame:
+    lowered = [t.lower() for t in texts]
+    return pd.DataFrame({
+        col: [bool(rx.search(t)) for t in lowered]
+        for col, rx in zip(HIT_COLUMNS, (_YES_RE, _NO_RE, _UNCERTAIN_RE))
+    })
+
+
+def nli_scores(texts: List[str], classifier) -> pd.DataFrame:
+    """Raw zero-shot scores per label (HuggingFace GPU path, dataset batching)."""
+    results = classifier(
+        texts,
+        candidate_labels=LABELS,
+        hypothesis_template="This text suggests that AI sentience is {}.",
+        truncation=True,
+        batch_size=32
+    )
+    if isinstance(results, dict):  # single text edge case
+        results = [results]
+
+    by_label = [dict(zip(res["labels"], res["scores"])) for res in results]
+    return pd.DataFrame({
+        col: [float(d[lab]) for d in by_label] for col, lab in zip(SCORE_COLUMNS, LABELS)
+    })
+
+
+def rescore(raw: pd.DataFrame, params: Optional[StanceParams] = None) -> pd.DataFrame:
+    """
+    Vectorized stance rules over SCORE_COLUMNS + HIT_COLUMNS.
+    Rows with NLI scores get boosted, normalized and thresholded; rows without
+    (regex-only runs) fall back to the regex priority No > Yes > Uncertain > lean No.
+    Returns `stance` and `confidence`, aligned with `raw`'s index.
+    """
+    p = params or StanceParams()
+    hits = raw[HIT_COLUMNS].to_numpy(dtype=bool)
+    scores = raw[SCORE_COLUMNS].to_numpy(dtype=float)
+    labels = np.array(LABELS, dtype=object)
+    yes, no, unc = 0, 1, 2
+
+    # regex boosters + normalize
+    boosted = scores + hits * np.array([p.yes_boost, p.no_boost, p.uncertain_boost])
+    boosted /= boosted.sum(axis=1, keepdims=True)
+
+    best = boosted.argmax(axis=1) if len(boosted) else np.zeros(0, dtype=int)
+    best_score = boosted.max(axis=1, initial=-np.inf)
+    yes_wins = boosted[:, yes] >= boosted[:, no]
+    tie = (best == unc) & (np.abs(boosted[:, yes] - boosted[:, no]) < p.tie_margin)
+
+    # shrink "Uncertain"
+    nli_stance = np.where(
+        best_score < p.uncertain_threshold, "Uncertain",
+        np.where(tie, np.where(yes_wins, "Yes", "No"), labels[best]),
+    )
+    nli_conf = np.where(
+        (best_score >= p.uncertain_threshold) & tie,
+        np.maximum(boosted[:, yes], boosted[:, no]),
+        best_score,
+    )
+
+    # regex-only fallback
+    regex_stance = np.select([hits[:, no], hits[:, yes], hits[:, unc]], ["No", "Yes", "Uncertain"], "No")
+    regex_conf = np.select(
+        [hits[:, no], hits[:, yes], hits[:, unc]],
+        [p.regex_no_confidence, p.regex_yes_confidence, p.regex_uncertain_confidence],
+        p.regex_default_confidence,
+    )
+
+    has_scores = ~np.isnan(scores).any(axis=1)
+    return pd.DataFrame({
+        "stance": np.where(has_scores, nli_stance, regex_stance),
+        "confidence": np.where(has_scores, nli_conf, regex_conf),
+    }, index=raw.index)
+
+
+def classify_all(texts: List[str], classifier=None, params: Optional[StanceParams] = None) -> pd.DataFrame:
+    """
+    Zero-shot NLI scores plus regex boosters (regex-only when no classifier is loaded).
+    Returns `stance` and `confidence` plus the raw SCORE_COLUMNS/HIT_COLUMNS, so the
+    stance can be re-derived later with `rescore` without rerunning the model.
+    """
+    raw = regex_hits(texts)
+    if classifier:
+        raw = raw.join(nli_scores(texts, classifier))
+    else:
+        for col in SCORE_COLUMNS:
+            raw[col] = np.nan
+    return rescore(raw, params).join(raw)
@@ -0,0 +1,91 @@
+# src/ai_opinion/readonly.py
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Hashable, Optional, Tuple
+
+
+class ReadOnlyPool:
+    """
+    A fixed set of read-only SQLite connections shared between threads
+    (Streamlit sessions, HTTP handlers). Connections are opened lazily.
+    """
+    def __init__(self, path: str, size: int = 4):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON;")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        with self._lock:
+            reserve = self._idle.empty() and self._opened < self.size
+            if reserve:
+                self._opened += 1
+        if reserve:
+            try:
+                conn = self._open()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1  # give the slot back, or later callers wait forever
+                raise
+        else:
+            conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def data_version(self) -> Tuple[int, Optional[str]]:
+        """
+        (version, updated_at) from the change counter kept by `DB`.
+        Databases created before the counter existed report (0, None).
+        """
+        with self.connection() as conn:
+            try:
+                row = conn.execute("SELECT version, updated_at FROM data_version WHERE id = 1").fetchone()
+            except sqlite3.OperationalError:
+                row = None
+        return tuple(row) if row else (0, None)
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get().close()
+        self._opened = 0
+
+
+class LRUCache:
+    """Thread-safe dict with a size bound; the least recently used entry is evicted first."""
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
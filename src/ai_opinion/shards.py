@@ -0,0 +1,204 @@
+# src/ai_opinion/shards.py
+import json
+import os
+import socket
+import time
+import traceback
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .db import DB
+from .sources.arxiv_source import ArxivSource
+from .sources.openalex_source import OpenAlexSource
+from .sources.crossref_source import CrossRefSource
+from .sources.psyarxiv_source import PsyArxivSource
+
+SOURCES = {
+    "arxiv": ArxivSource,
+    "openalex": OpenAlexSource,
+    "crossref": CrossRefSource,
+    "psyarxiv": PsyArxivSource,
+}
+
+MANIFEST = "manifest.json"
+
+# Layout of a shard directory:
+#   manifest.json          the plan: query terms, per-shard cap and the shard list
+#   <id>.sqlite            a finished shard (written as <id>.sqlite.part, renamed on success)
+#   <id>.done.json         completion marker with record counts; gains merged_at after merge
+#   <id>.failed.json       last error for a shard that should be retried
+# Each worker only writes files named after its own shard, so workers on several machines
+# can share the directory (or copy their files back) without locking a common manifest.
+
+
+@dataclass
+class Shard:
+    source: str
+    start_year: int
+    end_year: int
+
+    @property
+    def shard_id(self) -> str:
+        return f"{self.source}-{self.start_year}-{self.end_year}"
+
+
+def plan_shards(sources: List[str], start_year: int, end_year: int, window_years: int = 1) -> List[Shard]:
+    """One shard per (source, window of `window_years` publication years)."""
+    unknown = set(sources) - set(SOURCES)
+    if unknown:
+        raise ValueError(f"Unknown sources: {sorted(unknown)} (choose from {sorted(SOURCES)})")
+
+    shards = []
+    for source in sources:
+        for lo in range(start_year, end_year + 1, window_years):
+            shards.append(Shard(source, lo, min(lo + window_years - 1, end_year)))
+    return shards
+
+
+def write_manifest(directory: str, shards: List[Shard], terms: List[str], max_records: int) -> Path:
+    out = Path(directory)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "terms": terms,
+        "max_records": max_records,
+        "created_at": datetime.utcnow().isoformat(),
+        "shards": [{"id": s.shard_id, **asdict(s)} for s in shards],
+    }
+    _write_json(out / MANIFEST, manifest)
+    return out / MANIFEST
+
+
+def load_manifest(directory: str) -> dict:
+    return json.loads((Path(directory) / MANIFEST).read_text())
+
+
+def shard_status(directory: str, shard_id: str) -> str:
+    """pending | failed | done | merged"""
+    base = Path(directory)
+    done = base / f"{shard_id}.done.json"
+    if done.exists():
+        return "merged" if "merged_at" in json.loads(done.read_text()) else "done"
+    if (base / f"{shard_id}.failed.json").exists():
+        return "failed"
+    return "pending"
+
+
+def status_counts(directory: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for shard in load_manifest(directory)["shards"]:
+        status = shard_status(directory, shard["id"])
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def select_shards(directory: str, node: int = 0, nodes: int = 1,
+                  shard_ids: Optional[List[str]] = None) -> List[dict]:
+    """Shards this node should (re)run: not yet done, and assigned to `node` of `nodes` round-robin."""
+    picked = []
+    for i, shard in enumerate(load_manifest(directory)["shards"]):
+        if shard_ids and shard["id"] not in shard_ids:
+            continue
+        if not shard_ids and i % nodes != node:
+            continue
+        if shard_status(directory, shard["id"]) in ("pending", "failed"):
+            picked.append(shard)
+    return picked
+
+
+def run_shard(directory: str, shard: dict, terms: List[str], max_records: int) -> dict:
+    """
+    Harvest one shard into its own SQLite file. Safe to rerun: a partial file from a
+    crashed attempt is discarded. Returns the completion (or failure) marker.
+    Runs in a worker process, so it opens its own DB.
+    """
+    base = Path(directory)
+    shard_id = shard["id"]
+    part = base / f"{shard_id}.sqlite.part"
+    _remove_db(part)
+
+    started = time.perf_counter()
+    try:
+        src = SOURCES[shard["source"]](
+            terms,
+            start_year=shard["start_year"],
+            end_year=shard["end_year"],
+            max_records=max_records,
+            raise_errors=True,  # a fetch error must fail the shard, not finish it early
+        )
+        db = DB(str(part))
+        collected = 0
+        batch = []
+        for article in src.fetch():
+            batch.append(article)
+            if len(batch) >= 1000:
+                collected += db.upsert_articles(batch)
+                batch = []
+        collected += db.upsert_articles(batch)
+        db.conn.execute("PRAGMA journal_mode = DELETE;")  # fold the WAL back in before the rename
+        db.conn.close()
+        os.replace(part, base / f"{shard_id}.sqlite")
+    except Exception as e:
+        _remove_db(part)
+        marker = {
+            "id": shard_id,
+            "error": f"{e.__class__.__name__}: {e}",
+            "traceback": traceback.format_exc(),
+            "host": socket.gethostname(),
+            "failed_at": datetime.utcnow().isoformat(),
+        }
+        _write_json(base / f"{shard_id}.failed.json", marker)
+        return marker
+
+    marker = {
+        "id": shard_id,
+        "records": collected,
+        "seconds": round(time.perf_counter() - started, 2),
+        "host": socket.gethostname(),
+        "finished_at": datetime.utcnow().isoformat(),
+    }
+    _write_json(base / f"{shard_id}.done.json", marker)
+    (base / f"{shard_id}.failed.json").unlink(missing_ok=True)
+    return marker
+
+
+def merge_shards(directory: str, db_path: str, remerge: bool = False):
+    """
+    Merge finished shards into the main DB, deduplicating on (source, external_id).
+    Already-merged shards are skipped unless `remerge`. Shards marked done whose
+    `<id>.sqlite` is not here (e.g. not yet copied back from another machine) are
+    skipped and left unmerged. Returns (new articles per shard, ids of missing shards).
+    """
+    base = Path(directory)
+    db = DB(db_path)
+    added, missing = {}, []
+    for shard in load_manifest(directory)["shards"]:
+        status = shard_status(directory, shard["id"])
+        if status != "done" and not (remerge and status == "merged"):
+            continue
+
+        try:
+            added[shard["id"]] = db.merge_from(str(base / f"{shard['id']}.sqlite"))
+        except FileNotFoundError:
+            missing.append(shard["id"])
+            continue
+
+        done = base / f"{shard['id']}.done.json"
+        marker = json.loads(done.read_text())
+        marker.update(merged_at=datetime.utcnow().isoformat(), merged_into=str(db_path),
+                      merged_new=added[shard["id"]])
+        _write_json(done, marker)
+    return added, missing
+
+
+def _remove_db(path: Path):
+    for p in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+        p.unlink(missing_ok=True)
+
+
+def _write_json(path: Path, data: dict):
+    """Write via a temp file + rename so readers never see a half-written marker."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
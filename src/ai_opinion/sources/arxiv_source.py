@@ -1,62 +1,91 @@
 # src/ai_opinion/sources/arxiv_source.py
+import math
+import time
 import requests
 import feedparser
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 from datetime import datetime
+from ..config import ARXIV_BASE_URL, ARXIV_DELAY_SECONDS
 from ..types import Article
 from ..processing.nlp import clean_text
+from .http import get_with_retry
 
 class ArxivSource:
-    BASE_URL = "https://export.arxiv.org/api/query"
+    BASE_URL = ARXIV_BASE_URL
+    PAGE_SIZE = 200
+    DELAY_SECONDS = ARXIV_DELAY_SECONDS  # pause between consecutive API requests
 
-    def __init__(self, query_terms: List[str], start_year: int, max_records: int = 200):
+    def __init__(self, query_terms: List[str], start_year: int, max_records: int = 200,
+                 end_year: Optional[int] = None, raise_errors: bool = False):
         self.query_terms = query_terms
         self.start_year = start_year
+        self.end_year = end_year  # inclusive; None means the current year
         self.max_records = max_records
+        self.raise_errors = raise_errors  # re-raise instead of warning and stopping (sharded runs)
 
     def fetch(self) -> Iterable[Article]:
         total = 0
-        current_year = datetime.now().year
+        end_year = self.end_year or datetime.now().year
         terms = " OR ".join(f"\"{t}\"" for t in self.query_terms)
 
-        for year in range(self.start_year, current_year + 1):
-            if total >= self.max_records:
-                break
-
+        session = requests.Session()
+        requested = False
+        for year in range(self.start_year, end_year + 1):
             query = f"({terms}) AND submittedDate:[{year}01010000 TO {year}12312359]"
-            url = f"{self.BASE_URL}?search_query={query}&sortBy=submittedDate&sortOrder=descending&max_results=200"
 
-            try:
-                r = requests.get(url, timeout=30)
-                r.raise_for_status()
-                parsed = feedparser.parse(r.text)
-            except Exception as e:
-                print(f"[WARN] arXiv fetch failed for {year}: {e}")
-                continue
+            # Split what is left of the cap over the remaining years, so early years can't
+            # use it all up; a year with fewer results leaves its share to the later ones.
+            year_cap = total + math.ceil((self.max_records - total) / (end_year - year + 1))
 
-            if not parsed.entries:
-                continue
+            # page through the year until it runs dry or reaches its share
+            start = 0
+            while total < year_cap:
+                if requested:
+                    time.sleep(self.DELAY_SECONDS)
+                requested = True
+                url = (
+                    f"{self.BASE_URL}?search_query={query}&sortBy=submittedDate&sortOrder=descending"
+                    f"&start={start}&max_results={self.PAGE_SIZE}"
+                )
+                try:
+                    r = get_with_retry(url, session=session)
+                    parsed = feedparser.parse(r.text)
+                except Exception as e:
+                    if self.raise_errors:
+                        raise
+                    print(f"[WARN] arXiv fetch failed for {year}: {e}")
+                    break
 
-            for entry in parsed.entries:
-                if total >= self.max_records:
+                if not parsed.entries:
                     break
 
-                published = None
-                try:
-                    published = datetime.strptime(entry.published, "%Y-%m-%dT%H:%M:%SZ")
-                    if published.year < self.start_year:
-                        continue
-                except Exception:
-                    pass
-
-                yield Article(
-                    source="arxiv",
-                    external_id=entry.id,
-                    title=entry.title.strip(),
-                    authors=[a.name for a in entry.authors] if hasattr(entry, "authors") else [],
-                    abstract=clean_text(entry.summary),
-                    url=entry.link,
-                    published=published,
-                    venue="arXiv",
-                )
-                total += 1
+                for entry in parsed.entries:
+                    if total >= year_cap:
+                        break
+
+                    published = None
+                    try:
+                        published = datetime.strptime(entry.published, "%Y-%m-%dT%H:%M:%SZ")
+                        if published.year < self.start_year:
+                            continue
+                    except Exception:
+                        pass
+
+                    yield Article(
+                        source="arxiv",
+                        external_id=entry.id,
+                        title=entry.title.strip(),
+                        authors=[a.name for a in entry.authors] if hasattr(entry, "authors") else [],
+                        abstract=clean_text(entry.summary),
+                        url=entry.link,
+                        published=published,
+                        venue="arXiv",
+                    )
+                    total += 1
+
+                if len(parsed.entries) < self.PAGE_SIZE:
+                    break
+                start += self.PAGE_SIZE
+
+            if total >= self.max_records:
+                break
@@ -1,36 +1,49 @@
 import requests
 from datetime import datetime
+from ..config import CROSSREF_BASE_URL as BASE_URL
 from ..types import Article
-
-BASE_URL = "https://api.crossref.org/works"
+from .http import get_with_retry
 
 class CrossRefSource:
     """
     Fetches philosophy/psychology papers from CrossRef.
     """
-    def __init__(self, query_terms, start_year: int, max_records: int = 100):
+    def __init__(self, query_terms, start_year: int, max_records: int = 100, end_year: int = None,
+                 raise_errors: bool = False):
         self.query_terms = query_terms
         self.start_year = start_year
+        self.end_year = end_year  # inclusive; None means no upper bound
         self.max_records = max_records
+        self.raise_errors = raise_errors  # re-raise instead of warning and stopping (sharded runs)
 
     def fetch(self):
         query = " ".join(self.query_terms)
         rows = 100
-        offset = 0
+        cursor = "*"  # deep paging; offset paging stops at 10,000 rows
         collected = 0
+        session = requests.Session()
+        date_filter = f"from-pub-date:{self.start_year}-01-01"
+        if self.end_year:
+            date_filter += f",until-pub-date:{self.end_year}-12-31"
 
         while collected < self.max_records:
             params = {
                 "query": query,
-                "filter": f"from-pub-date:{self.start_year}-01-01",
+                "filter": date_filter,
                 "rows": rows,
-                "offset": offset,
+                "cursor": cursor,
             }
-            resp = requests.get(BASE_URL, params=params)
-            resp.raise_for_status()
-            data = resp.json()
+            try:
+                resp = get_with_retry(BASE_URL, params=params, session=session)
+                data = resp.json()
+            except Exception as e:
+                if self.raise_errors:
+                    raise
+                print(f"⚠️ CrossRef fetch failed: {e}")
+                return
 
-            items = data.get("message", {}).get("items", [])
+            message = data.get("message", {})
+            items = message.get("items", [])
             if not items:
                 break
 
@@ -66,4 +79,6 @@ class CrossRefSource:
                 if collected >= self.max_records:
                     return
 
-            offset += rows
+            cursor = message.get("next-cursor")
+            if not cursor:
+                break
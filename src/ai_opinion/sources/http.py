@@ -0,0 +1,33 @@
+# src/ai_opinion/sources/http.py
+import time
+import requests
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def get_with_retry(url, params=None, session=None, timeout: float = 30, retries: int = 5,
+                   backoff: float = 1.0) -> requests.Response:
+    """
+    GET with retries on throttling (429), 5xx and connection errors.
+    Honours a numeric Retry-After header, otherwise backs off exponentially.
+    Raises like `raise_for_status` once retries are exhausted.
+    """
+    http = session or requests
+    for attempt in range(retries + 1):
+        try:
+            resp = http.get(url, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+            time.sleep(backoff * 2 ** attempt)
+            continue
+
+        if resp.status_code not in RETRY_STATUS or attempt == retries:
+            resp.raise_for_status()
+            return resp
+
+        try:
+            delay = float(resp.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = backoff * 2 ** attempt
+        time.sleep(min(delay, 60.0))
@@ -1,35 +1,49 @@
 import requests
 from datetime import datetime
+from ..config import OPENALEX_BASE_URL as BASE_URL
 from ..types import Article
-
-BASE_URL = "https://api.openalex.org/works"
+from .http import get_with_retry
 
 class OpenAlexSource:
-    def __init__(self, query_terms, start_year: int, max_records: int = 100):
+    def __init__(self, query_terms, start_year: int, max_records: int = 100, end_year: int = None,
+                 raise_errors: bool = False):
         self.query_terms = query_terms
         self.start_year = start_year
+        self.end_year = end_year  # inclusive; None means no upper bound
         self.max_records = max_records
+        self.raise_errors = raise_errors  # re-raise instead of warning and stopping (sharded runs)
 
     def fetch(self):
         query = " OR ".join([f'"{t}"' for t in self.query_terms])
+        date_filter = f"from_publication_date:{self.start_year}-01-01"
+        if self.end_year:
+            date_filter += f",to_publication_date:{self.end_year}-12-31"
         params = {
             "search": query,
-            "filter": f"from_publication_date:{self.start_year}-01-01",
+            "filter": date_filter,
             "per-page": 200,
         }
 
         collected = 0
         cursor = "*"
+        session = requests.Session()
         while collected < self.max_records:
-            resp = requests.get(BASE_URL, params={**params, "cursor": cursor})
-            resp.raise_for_status()
-            data = resp.json()
+            try:
+                resp = get_with_retry(BASE_URL, params={**params, "cursor": cursor}, session=session)
+                data = resp.json()
+            except Exception as e:
+                if self.raise_errors:
+                    raise
+                print(f"⚠️ OpenAlex fetch failed: {e}")
+                return
 
             for rec in data.get("results", []):
                 pub_date = rec.get("publication_date")
                 year = int(pub_date[:4]) if pub_date else None
                 if year and year < self.start_year:
                     continue
+                if year and self.end_year and year > self.end_year:
+                    continue
 
                 yield Article(
                     source="OpenAlex",
@@ -1,48 +1,73 @@
 # src/ai_opinion/sources/psyarxiv_source.py
 import requests
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 from datetime import datetime
+from ..config import PSYARXIV_BASE_URL
 from ..types import Article
 from ..processing.nlp import clean_text
+from .http import get_with_retry
 
 class PsyArxivSource:
-    BASE_URL = "https://api.osf.io/v2/preprints/"
+    BASE_URL = PSYARXIV_BASE_URL
+    PAGE_SIZE = 100  # OSF's maximum page[size]
 
-    def __init__(self, query_terms: List[str], start_year: int, max_records: int = 200):
+    def __init__(self, query_terms: List[str], start_year: int, max_records: int = 200,
+                 end_year: Optional[int] = None, raise_errors: bool = False):
         self.query_terms = query_terms
         self.start_year = start_year
+        self.end_year = end_year  # inclusive; None means no upper bound
         self.max_records = max_records
+        self.raise_errors = raise_errors  # re-raise instead of warning and stopping (sharded runs)
 
     def fetch(self) -> Iterable[Article]:
         q = " OR ".join(self.query_terms)
-        params = {"q": q, "page[size]": self.max_records, "provider": "psyarxiv"}
-        try:
-            r = requests.get(self.BASE_URL, params=params, timeout=30)
-            r.raise_for_status()
-            data = r.json()
-        except Exception as e:
-            print(f"⚠️ PsyArXiv fetch failed: {e}")
-            return
+        params = {"q": q, "page[size]": min(self.max_records, self.PAGE_SIZE), "provider": "psyarxiv"}
+        # Bound the query itself, so a year-window shard pages only through its own years
+        params["filter[date_published][gte]"] = f"{self.start_year}-01-01"
+        if self.end_year:
+            params["filter[date_published][lte]"] = f"{self.end_year}-12-31"
+        url = self.BASE_URL
+        session = requests.Session()
+        collected = 0
 
-        for rec in data.get("data", []):
-            attrs = rec.get("attributes", {})
-            pub_date = attrs.get("date_published") or attrs.get("date_created")
-            pub = None
-            if pub_date:
-                try:
-                    pub = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-                    if pub.year < self.start_year:
-                        continue
-                except:
-                    pub = None
+        # follow links.next until max_records
+        while url and collected < self.max_records:
+            try:
+                r = get_with_retry(url, params=params, session=session)
+                data = r.json()
+            except Exception as e:
+                if self.raise_errors:
+                    raise
+                print(f"⚠️ PsyArXiv fetch failed: {e}")
+                return
 
-            yield Article(
-                source="psyarxiv",
-                external_id=rec.get("id", ""),
-                title=attrs.get("title", "").strip(),
-                authors=[],
-                abstract=clean_text(attrs.get("description", "")),
-                url=attrs.get("doi") or attrs.get("links", {}).get("html"),
-                published=pub,
-                venue="PsyArXiv",
-            )
+            for rec in data.get("data", []):
+                attrs = rec.get("attributes", {})
+                pub_date = attrs.get("date_published") or attrs.get("date_created")
+                pub = None
+                if pub_date:
+                    try:
+                        pub = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
+                        if pub.year < self.start_year:
+                            continue
+                        if self.end_year and pub.year > self.end_year:
+                            continue
+                    except:
+                        pub = None
+
+                yield Article(
+                    source="psyarxiv",
+                    external_id=rec.get("id", ""),
+                    title=attrs.get("title", "").strip(),
+                    authors=[],
+                    abstract=clean_text(attrs.get("description", "")),
+                    url=attrs.get("doi") or attrs.get("links", {}).get("html"),
+                    published=pub,
+                    venue="PsyArXiv",
+                )
+                collected += 1
+                if collected >= self.max_records:
+                    return
+
+            url = (data.get("links") or {}).get("next")
+            params = None  # the next link already carries the query
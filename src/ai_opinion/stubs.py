@@ -0,0 +1,348 @@
+# src/ai_opinion/stubs.py
+"""
+Local stand-ins for the arXiv, OpenAlex, CrossRef and OSF (PsyArXiv) APIs, for load tests.
+Records are synthesized deterministically, so no payloads are stored. Each API keeps its own
+pagination scheme and payload shape, and the server injects latency, 429s and 5xx errors.
+"""
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlencode, urlparse
+from xml.sax.saxutils import escape
+
+SOURCES = ("arxiv", "openalex", "crossref", "psyarxiv")
+CROSSREF_MAX_OFFSET = 10_000  # the real API rejects larger offsets
+
+_WORDS = (
+    "artificial intelligence language model consciousness sentience machine learning agent "
+    "awareness cognition neural network alignment ethics moral status welfare subjective experience "
+    "benchmark reasoning embodiment philosophy mind theory evaluation safety policy"
+).split()
+_PHRASES = [
+    "We argue that current systems are not sentient.",
+    "Machines might be conscious under some theories.",
+    "The model shows artificial consciousness in limited settings.",
+    "There is no evidence of sentience in large language models.",
+    "Whether AI can be sentient remains an open question of consciousness.",
+    "",
+]
+
+
+class StubHTTPError(Exception):
+    """Raised by a stub route to answer with an error status, as the real API would."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class StubConfig:
+    corpus: Dict[str, int] = field(default_factory=lambda: {s: 1000 for s in SOURCES})
+    start_year: int = 2020
+    end_year: int = field(default_factory=lambda: datetime.now().year)
+    latency_median_ms: float = 40.0
+    latency_sigma: float = 0.6      # lognormal shape: larger means a heavier tail
+    throttle_rate: float = 0.02     # share of requests answered with 429
+    error_rate: float = 0.005       # share of requests answered with 503
+    retry_after: float = 0.2        # seconds, sent on 429
+    seed: int = 0
+
+
+class StubServer:
+    """
+    Serves every stub API on one port under /arxiv, /openalex, /crossref and /osf.
+    GET /_stats returns request counts and latency percentiles per source.
+    """
+    def __init__(self, config: StubConfig, host: str = "127.0.0.1", port: int = 0):
+        self.config = config
+        self._latencies = {s: [] for s in SOURCES}
+        self._statuses = {s: {} for s in SOURCES}
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_urls(self) -> Dict[str, str]:
+        """Environment overrides understood by ai_opinion.config."""
+        return {
+            "ARXIV_BASE_URL": f"{self.url}/arxiv/api/query",
+            "OPENALEX_BASE_URL": f"{self.url}/openalex/works",
+            "CROSSREF_BASE_URL": f"{self.url}/crossref/works",
+            "PSYARXIV_BASE_URL": f"{self.url}/osf/v2/preprints/",
+        }
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = {}
+            for source in SOURCES:
+                lat = sorted(self._latencies[source])
+                out[source] = {
+                    "requests": len(lat),
+                    "statuses": dict(self._statuses[source]),
+                    "latency_ms": {
+                        "p50": _percentile(lat, 50),
+                        "p95": _percentile(lat, 95),
+                        "p99": _percentile(lat, 99),
+                        "max": round(lat[-1], 2) if lat else None,
+                    },
+                }
+            return out
+
+    # --------------------------
+    # Fault / latency injection
+    # --------------------------
+    def _disturb(self):
+        """Sleep for a sampled latency; return an error status to send instead, or None."""
+        c = self.config
+        with self._lock:
+            delay = self._rng.lognormvariate(math.log(c.latency_median_ms / 1000.0), c.latency_sigma)
+            roll = self._rng.random()
+        time.sleep(delay)
+        if roll < c.throttle_rate:
+            return 429
+        if roll < c.throttle_rate + c.error_rate:
+            return 503
+        return None
+
+    def _record(self, source: str, status: int, started: float):
+        with self._lock:
+            self._latencies[source].append((time.perf_counter() - started) * 1000.0)
+            self._statuses[source][status] = self._statuses[source].get(status, 0) + 1
+
+    # --------------------------
+    # Synthetic corpus
+    # --------------------------
+    def _years(self):
+        return list(range(self.config.start_year, self.config.end_year + 1))
+
+    def _record_fields(self, source: str, i: int, year: int = None) -> dict:
+        rng = random.Random(f"{self.config.seed}:{source}:{i}")  # str seeds are stable across runs
+        year = year or self._years()[i % len(self._years())]
+        published = datetime(year, rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23))
+        return {
+            "title": " ".join(rng.choices(_WORDS, k=rng.randint(5, 12))).capitalize(),
+            "abstract": " ".join(rng.choices(_WORDS, k=rng.randint(60, 160))) + " " + rng.choice(_PHRASES),
+            "authors": [f"Author {rng.randint(1, 50000)}" for _ in range(rng.randint(1, 6))],
+            "published": published,
+        }
+
+    def _window(self, source: str, lo: int, hi: int, start: int, stop: int):
+        """
+        Record indices [start, stop) of `source`'s records published in years lo..hi, plus
+        how many such records exist. Record i is from year i % len(years), so this is
+        arithmetic rather than a scan of the corpus.
+        """
+        years = self._years()
+        n, total = len(years), self.config.corpus[source]
+        residues = [r for r, y in enumerate(years) if lo <= y <= hi and r < total]
+        count = sum((total - r + n - 1) // n for r in residues)
+        if not residues:
+            return [], 0
+        m = len(residues)
+        return [(k // m) * n + residues[k % m] for k in range(start, min(stop, count))], count
+
+    def arxiv(self, qs: dict):
+        """
+        Atom feed; one year per query (submittedDate filter), paged with start/max_results.
+        The arXiv corpus is split evenly over the years (rounded down).
+        """
+        m = re.search(r"submittedDate:\[(\d{4})", qs.get("search_query", [""])[0])
+        year = int(m.group(1)) if m else self.config.start_year
+        years = self._years()
+        per_year = self.config.corpus["arxiv"] // len(years) if year in years else 0
+        start = int(qs.get("start", ["0"])[0])
+        size = int(qs.get("max_results", ["10"])[0])
+
+        entries = []
+        for j in range(start, min(start + size, per_year)):
+            i = years.index(year) * per_year + j
+            f = self._record_fields("arxiv", i, year)
+            authors = "".join(f"<author><name>{escape(a)}</name></author>" for a in f["authors"])
+            entries.append(
+                f"<entry><id>http://arxiv.org/abs/{year}.{j:07d}v1</id>"
+                f"<published>{f['published']:%Y-%m-%dT%H:%M:%SZ}</published>"
+                f"<title>{escape(f['title'])}</title><summary>{escape(f['abstract'])}</summary>"
+                f"{authors}<link href=\"http://arxiv.org/abs/{year}.{j:07d}v1\" rel=\"alternate\" type=\"text/html\"/>"
+                f"</entry>"
+            )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">' + "".join(entries) + "</feed>"
+        )
+        return "application/atom+xml", body
+
+    def openalex(self, qs: dict):
+        """
+        JSON with results[] and meta.next_cursor (cursor paging); honours the
+        from_publication_date / to_publication_date filter.
+        """
+        bounds = dict(f.split(":", 1) for f in qs.get("filter", [""])[0].split(",") if ":" in f)
+        lo = int(bounds.get("from_publication_date", "0")[:4])
+        hi = int(bounds.get("to_publication_date", "9999")[:4])
+        cursor = qs.get("cursor", ["*"])[0]
+        offset = 0 if cursor == "*" else int(cursor)
+        size = int(qs.get("per-page", ["25"])[0])
+        indices, total = self._window("openalex", lo, hi, offset, offset + size)
+
+        results = []
+        for i in indices:
+            f = self._record_fields("openalex", i)
+            results.append({
+                "id": f"https://openalex.org/W{i}",
+                "title": f["title"],
+                "publication_date": f"{f['published']:%Y-%m-%d}",
+                "authorships": [{"author": {"display_name": a}} for a in f["authors"]],
+                "abstract": f["abstract"],
+                "host_venue": {"display_name": "Stub Journal of AI"},
+            })
+        next_cursor = str(offset + size) if offset + size < total else None
+        return "application/json", json.dumps({"meta": {"next_cursor": next_cursor}, "results": results})
+
+    def crossref(self, qs: dict):
+        """
+        JSON message.items[]; honours the from-pub-date / until-pub-date filter. Pages with
+        cursor / next-cursor (deep paging), or with offset/rows, which, like the real API,
+        is rejected beyond CROSSREF_MAX_OFFSET.
+        """
+        bounds = dict(f.split(":", 1) for f in qs.get("filter", [""])[0].split(",") if ":" in f)
+        lo = int(bounds.get("from-pub-date", "0")[:4])
+        hi = int(bounds.get("until-pub-date", "9999")[:4])
+        rows = int(qs.get("rows", ["20"])[0])
+        cursor = qs.get("cursor", [None])[0]
+        if cursor is not None:
+            offset = 0 if cursor == "*" else int(cursor)
+        else:
+            offset = int(qs.get("offset", ["0"])[0])
+            if offset > CROSSREF_MAX_OFFSET:
+                raise StubHTTPError(400, f"offset cannot exceed {CROSSREF_MAX_OFFSET}; use cursor paging")
+        indices, total = self._window("crossref", lo, hi, offset, offset + rows)
+
+        items = []
+        for i in indices:
+            f = self._record_fields("crossref", i)
+            items.append({
+                "DOI": f"10.5555/stub.{i}",
+                "title": [f["title"]],
+                "author": [dict(zip(("given", "family"), a.split(" ", 1))) for a in f["authors"]],
+                "abstract": f["abstract"],
+                "URL": f"https://doi.org/10.5555/stub.{i}",
+                "created": {"date-time": f"{f['published']:%Y-%m-%dT%H:%M:%SZ}"},
+                "container-title": ["Stub Proceedings"],
+            })
+        message = {"total-results": total, "items": items}
+        if cursor is not None:
+            message["next-cursor"] = str(offset + rows)  # the real API always sends one; an empty page ends
+        return "application/json", json.dumps({"message": message})
+
+    def osf(self, qs: dict, base: str):
+        """JSON:API data[] with links.next (page number paging), honouring filter[date_published]."""
+        page = int(qs.get("page", ["1"])[0])
+        size = int(qs.get("page[size]", ["10"])[0])
+        lo = int(qs.get("filter[date_published][gte]", ["0"])[0][:4])
+        hi = int(qs.get("filter[date_published][lte]", ["9999"])[0][:4])
+        start = (page - 1) * size
+        indices, total = self._window("psyarxiv", lo, hi, start, start + size)
+
+        data = []
+        for i in indices:
+            f = self._record_fields("psyarxiv", i)
+            data.append({
+                "id": f"stub{i}",
+                "attributes": {
+                    "title": f["title"],
+                    "description": f["abstract"],
+                    "date_published": f"{f['published']:%Y-%m-%dT%H:%M:%S.000000Z}",
+                    "doi": f"https://doi.org/10.31234/osf.io/stub{i}",
+                },
+            })
+        links = {"next": None}
+        if start + size < total:
+            nxt = {k: v[0] for k, v in qs.items()}
+            nxt["page"] = page + 1
+            links["next"] = f"{base}?{urlencode(nxt)}"
+        return "application/vnd.api+json", json.dumps({"data": data, "links": links})
+
+
+def _make_handler(server: StubServer):
+    routes = {
+        "/arxiv/": "arxiv",
+        "/openalex/": "openalex",
+        "/crossref/": "crossref",
+        "/osf/": "psyarxiv",
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+
+        def do_GET(self):
+            started = time.perf_counter()
+            parsed = urlparse(self.path)
+            if parsed.path == "/_stats":
+                return self._send(200, "application/json", json.dumps(server.stats()))
+
+            source = next((s for prefix, s in routes.items() if parsed.path.startswith(prefix)), None)
+            if source is None:
+                return self._send(404, "text/plain", "unknown stub route")
+
+            status = server._disturb()
+            if status == 429:
+                self._send(429, "text/plain", "slow down", {"Retry-After": str(server.config.retry_after)})
+            elif status:
+                self._send(status, "text/plain", "stub failure")
+            else:
+                qs = parse_qs(parsed.query)
+                try:
+                    if source == "psyarxiv":
+                        host = self.headers.get("Host")
+                        ctype, body = server.osf(qs, f"http://{host}{parsed.path}")
+                    else:
+                        ctype, body = getattr(server, source)(qs)
+                    status = 200
+                except StubHTTPError as e:
+                    status, ctype, body = e.status, "text/plain", str(e)
+                self._send(status, ctype, body)
+            server._record(source, status, started)
+
+        def _send(self, status: int, ctype: str, body: str, headers: dict = None):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _percentile(sorted_values, pct: float):
+    if not sorted_values:
+        return None
+    k = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return round(sorted_values[k], 2)
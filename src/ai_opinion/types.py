@@ -3,7 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)  # no per-instance __dict__; harvests hold many of these
 class Article:
     source: str
     external_id: str # e.g., arXiv ID or EuropePMC ID
@@ -0,0 +1,133 @@
+# src/ai_opinion/views.py
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from .readonly import LRUCache, ReadOnlyPool
+
+STANCE_ORDER = ["Yes", "Uncertain", "No"]
+
+
+@dataclass(frozen=True)
+class FilteredView:
+    """Everything the dashboard renders for one filter state. Treat the frames as read-only."""
+    articles: pd.DataFrame
+    stance_counts: pd.DataFrame
+    trend: pd.DataFrame
+    examples: dict
+    topics: pd.DataFrame
+
+
+class DashboardData:
+    """
+    Read-only data layer for the Streamlit dashboard.
+    The corpus is reloaded only when the DB's data version changes; filtered
+    views are memoized per (version, filters) in an LRU cache.
+    """
+    def __init__(self, path: str, max_views: int = 32, pool_size: int = 2, years_back: int = 5):
+        self.pool = ReadOnlyPool(path, size=pool_size)
+        self.views = LRUCache(max_views)
+        self.years_back = years_back
+        self._corpus = (None, None, 0)  # (version, articles, pending)
+        self._lock = threading.Lock()
+
+    def version(self) -> Tuple[int, Optional[str]]:
+        return self.pool.data_version()
+
+    def corpus(self) -> Tuple[pd.DataFrame, int]:
+        """Classified articles from the last `years_back` years, and the number still unclassified."""
+        _, df, pending = self._snapshot()
+        return df, pending
+
+    def _snapshot(self):
+        version = self.version()
+        with self._lock:
+            if self._corpus[0] != version:
+                self._corpus = (version, *self._load())
+                self.views.clear()
+            return self._corpus
+
+    def _load(self) -> Tuple[pd.DataFrame, int]:
+        with self.pool.connection() as conn:
+            # Stances are written by scripts/run_classify.py; the dashboard only reads them.
+            df = pd.read_sql_query("""
+                SELECT a.id, a.source, a.title, a.abstract, a.url, a.published, a.topics,
+                       s.stance, s.confidence, s.backend
+                FROM articles a
+                LEFT JOIN stances s ON s.article_id = a.id
+                WHERE a.published IS NOT NULL
+            """, conn)
+
+        df["year"] = pd.to_datetime(df["published"], errors="coerce", utc=True, format="ISO8601").dt.year
+        df = df[df["year"].notna() & (df["year"] >= datetime.now().year - self.years_back)]
+        df["year"] = df["year"].astype(int)
+        df["source"] = df["source"].astype("category")
+
+        pending = int(df["stance"].isna().sum())
+        df = df[df["stance"].notna()].reset_index(drop=True)
+        df["title_l"] = df["title"].fillna("").str.lower()
+        df["abstract_l"] = df["abstract"].fillna("").str.lower()
+        return df, pending
+
+    def year_bounds(self, sources: Tuple[str, ...] = ()) -> Tuple[int, int]:
+        version, df, _ = self._snapshot()
+        key = ("years", version, tuple(sources))
+        bounds = self.views.get(key)
+        if bounds is None:
+            years = df.loc[df["source"].isin(sources), "year"] if sources else df["year"]
+            bounds = (int(years.min()), int(years.max())) if len(years) else (0, 0)
+            self.views.put(key, bounds)
+        return bounds
+
+    def view(self, sources: Tuple[str, ...] = (), year_range: Optional[Tuple[int, int]] = None,
+             query: str = "") -> FilteredView:
+        version, df, _ = self._snapshot()
+        key = ("view", version, tuple(sources), tuple(year_range or ()), query.lower())
+        cached = self.views.get(key)
+        if cached is None:
+            cached = self._build_view(df, *key[2:])
+            self.views.put(key, cached)
+        return cached
+
+    def _build_view(self, df, sources, year_range, ql) -> FilteredView:
+        mask = pd.Series(True, index=df.index)
+        if sources:
+            mask &= df["source"].isin(sources)
+        if year_range:
+            mask &= df["year"].between(*year_range)
+        if ql:
+            mask &= (
+                df["title_l"].str.contains(ql, regex=False)
+                | df["abstract_l"].str.contains(ql, regex=False)
+            )
+        df = df[mask]
+
+        stance_counts = df["stance"].value_counts().reset_index()
+        stance_counts.columns = ["stance", "count"]
+
+        trend = df.groupby(["year", "stance"]).size().reset_index(name="count")
+        trend["prop"] = trend["count"] / trend.groupby("year")["count"].transform("sum")
+        trend["stance"] = pd.Categorical(trend["stance"], categories=STANCE_ORDER, ordered=True)
+
+        examples = {
+            stance: df[df["stance"] == stance].nlargest(5, "confidence")
+            for stance in STANCE_ORDER
+        }
+
+        topics = df.nlargest(200, "year")[["title", "topics", "stance", "year"]].copy()
+        topics["topic_list"] = topics.pop("topics").apply(_list_topics)
+        topics = topics[["title", "topic_list", "stance", "year"]]
+
+        return FilteredView(df, stance_counts, trend, examples, topics)
+
+
+def _list_topics(x) -> str:
+    try:
+        arr = json.loads(x) if isinstance(x, str) else x
+        return ", ".join(arr or [])
+    except Exception:
+        return ""